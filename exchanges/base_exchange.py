@@ -11,17 +11,71 @@ Provides abstract base class for all exchange integrations with:
 
 import abc
 import asyncio
+import json
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from decimal import ROUND_DOWN, Decimal
 from enum import Enum
-from typing import Optional, Dict, List, Any, Callable, Tuple
+from typing import Optional, Dict, List, Any, Awaitable, Callable, Tuple, TYPE_CHECKING
 from abc import ABC, abstractmethod
-import pandas as pd
 import aiohttp
 from functools import wraps
 from collections import deque
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# orjson for REST bodies and WS frames; stdlib json when it isn't installed
+if orjson is not None:
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+def json_dumps_str(obj: Any) -> str:
+    """Serialize to str for text WS frames and aiohttp's json_serialize hook"""
+    return json_dumps(obj).decode()
+
+
+def retry_after(header: Optional[str], default: float) -> float:
+    """Seconds to wait from a Retry-After header, else the backoff default"""
+    try:
+        return max(0.0, float(header))
+    except (TypeError, ValueError):
+        return default
+
+
+def format_decimal(value: float, decimals: Optional[int]) -> str:
+    """Render a price at the symbol's precision (plain str() if unknown)"""
+    if decimals is None:
+        return str(value)
+    return f"{value:.{decimals}f}"
+
+
+def format_quantity(value: float, decimals: Optional[int]) -> str:
+    """Render a quantity at the symbol's precision, truncated toward zero
+    
+    Rounding to nearest could push a quantity above the available balance
+    or position, which the exchange rejects.
+    """
+    if decimals is None:
+        return str(value)
+    return format(Decimal(str(value)).quantize(Decimal(1).scaleb(-decimals), rounding=ROUND_DOWN), "f")
+
 
 class OrderType(Enum):
     """Supported order types"""
@@ -84,9 +138,9 @@ class Order:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Ticker:
-    """Real-time ticker data"""
+    """Real-time ticker data (slotted: built on every ticker poll/update)"""
     symbol: str
     bid: float
     ask: float
@@ -99,9 +153,9 @@ class Ticker:
     change_pct_24h: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OHLCV:
-    """OHLCV candlestick data"""
+    """OHLCV candlestick data (slotted: built per candle, up to 1000 per call)"""
     timestamp: float
     open: float
     high: float
@@ -110,6 +164,38 @@ class OHLCV:
     volume: float
 
 
+@dataclass(slots=True)
+class OHLCVBatch:
+    """Struct-of-arrays candles: one numpy column per field
+    
+    Indicators and backtests work on whole columns, so this avoids
+    building an OHLCV object per candle.
+    """
+    timestamp: "np.ndarray"  # datetime64[s]
+    open: "np.ndarray"
+    high: "np.ndarray"
+    low: "np.ndarray"
+    close: "np.ndarray"
+    volume: "np.ndarray"
+    
+    def __len__(self) -> int:
+        return len(self.timestamp)
+    
+    def as_ohlcv_list(self) -> List[OHLCV]:
+        """Per-candle OHLCV objects, for callers of the list-based API"""
+        return [
+            OHLCV(timestamp=ts, open=o, high=h, low=l, close=c, volume=v)
+            for ts, o, h, l, c, v in zip(
+                self.timestamp.astype("datetime64[us]").tolist(),
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist()
+            )
+        ]
+
+
 class RateLimiter:
     """Rate limiting utility with exponential backoff"""
     
@@ -146,6 +232,89 @@ class RateLimiter:
                 await asyncio.sleep(wait_time)
 
 
+class TokenBucket:
+    """Token-bucket rate limiter driven by monotonic time
+    
+    Tokens refill continuously up to `capacity`, so requests are paced
+    smoothly instead of over-admitting at fixed window boundaries.
+    """
+    
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Take one token, waiting for the refill if the bucket is empty
+        
+        The uncontended path never touches the lock: nothing can interleave
+        between the refill and the decrement on a single event loop. Only
+        callers that must wait queue on the lock, which keeps them FIFO.
+        """
+        if not self._lock.locked() and self._take():
+            return
+        async with self._lock:
+            while not self._take():
+                await asyncio.sleep((1 - self.tokens) / self.refill_per_sec)
+    
+    def _take(self) -> bool:
+        """Refill from elapsed time and take a token if one is available"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_per_sec)
+        self.last = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+    
+    def drain(self) -> None:
+        """Empty the bucket, e.g. when the server reports the quota is spent"""
+        self.tokens = 0.0
+        self.last = time.monotonic()
+
+
+class LLMEventQueue:
+    """Bounded queue of LLM events run in order by one background worker
+    
+    put() never waits, so request and WS paths don't stall on slow
+    callbacks. When the queue is full the oldest pending event is dropped.
+    """
+    
+    def __init__(self, handler: Callable[[str, Dict[str, Any]], Awaitable[Any]], maxsize: int):
+        self.handler = handler
+        self.dropped = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._worker: Optional[asyncio.Task] = None
+    
+    def put(self, event: str, payload: Dict[str, Any]) -> None:
+        """Queue an event, starting the worker on first use"""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._drain())
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+            logger.warning(f"LLM callback queue full, dropped oldest event for {event}")
+        self._queue.put_nowait((event, payload))
+    
+    async def _drain(self) -> None:
+        """Run queued events in order"""
+        while True:
+            event, payload = await self._queue.get()
+            try:
+                await self.handler(event, payload)
+            except Exception as e:
+                logger.error(f"LLM callback error ({event}): {e}")
+    
+    async def close(self) -> None:
+        """Stop the worker; events still queued are discarded"""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+
 class BaseExchange(ABC):
     """Abstract base class for all exchange integrations
     
@@ -196,7 +365,7 @@ class BaseExchange(ABC):
     
     @abstractmethod
     async def get_historical_data(self, symbol: str, timeframe: str, 
-                                 limit: int = 100) -> pd.DataFrame:
+                                 limit: int = 100) -> "pd.DataFrame":
         """Get historical OHLCV data for analysis"""
         pass
     
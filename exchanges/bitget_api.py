@@ -10,26 +10,71 @@ Provides unified interface for Bitget spot, margin, and copy trading with:
 """
 
 import asyncio
+import copy
 import hashlib
 import hmac
 import json
 import logging
 import os
+import random
 import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 import aiohttp
 import base64
 
 from .base_exchange import (
     BaseExchange, Order, OrderType, Side, OrderStatus,
-    Ticker, OHLCV, RateLimiter
+    Ticker, OHLCV, TokenBucket, LLMEventQueue,
+    format_decimal, format_quantity, json_dumps_str, json_loads, retry_after
 )
 
 logger = logging.getLogger(__name__)
 
+# Symbol catalog changes rarely; refresh it at most every 5 minutes
+_RULES_TTL = 300.0
+
+# Decorrelated-jitter retry bounds (seconds) and the errors worth retrying.
+# Timeouts and disconnects are retried for GET only: a POST may already have
+# been applied, so it is retried only when the connect itself failed.
+_RETRY_BASE = 0.5
+_RETRY_CAP = 8.0
+_RETRYABLE_ERRORS = (
+    aiohttp.ClientConnectorError,
+    aiohttp.ServerDisconnectedError,
+    asyncio.TimeoutError,
+)
+
+# Pending LLM events beyond this are dropped rather than stalling requests
+_CALLBACK_QUEUE_SIZE = 1024
+
+# Hot REST endpoints; full URLs are pre-joined per client in __init__
+_EP_TICKER = "/api/v2/spot/ticker"
+_EP_CANDLES = "/api/v2/spot/candles"
+_EP_ORDERS = "/api/v2/spot/orders"
+_EP_CANCEL_ORDER = "/api/v2/spot/cancel-order"
+_EP_ORDER_INFO = "/api/v2/spot/order-info"
+_EP_OPEN_ORDERS = "/api/v2/spot/open-orders"
+_EP_ORDER_BOOK = "/api/v2/spot/order-book"
+_EP_SYMBOLS = "/api/v2/spot/symbols"
+_EP_AMEND_ORDER = "/api/v2/spot/amend-order"
+_EP_BATCH_ORDERS = "/api/v2/spot/batch-orders"
+
+_HOT_ENDPOINTS = (
+    _EP_TICKER, _EP_CANDLES, _EP_ORDERS, _EP_CANCEL_ORDER, _EP_ORDER_INFO,
+    _EP_OPEN_ORDERS, _EP_ORDER_BOOK, _EP_SYMBOLS, _EP_AMEND_ORDER, _EP_BATCH_ORDERS,
+)
+
+
+def _to_scale(value: Any) -> Optional[int]:
+    """Parse a Bitget priceScale/quantityScale field"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
 
 class BitgetOrderType(Enum):
     """Bitget-specific order types"""
@@ -93,8 +138,34 @@ class BitgetAPI(BaseExchange):
             self.rest_base = "https://api.bitget.com"
             self.ws_base = "wss://ws.bitget.com"
         
-        self.rate_limiter = RateLimiter(max_requests=10, window_seconds=1)
+        # 10 requests/second, refilled continuously rather than per window
+        self.rate_limiter = TokenBucket(capacity=10, refill_per_sec=10)
+        
+        # Per-request constants, built once instead of on every _request
+        self._urls = {endpoint: self.rest_base + endpoint for endpoint in _HOT_ENDPOINTS}
+        self._header_tmpl = {
+            "ACCESS-KEY": self.api_key,
+            "ACCESS-PASSPHRASE": self.passphrase,
+            "Content-Type": "application/json"
+        }
+        # Keyed HMAC with the ipad/opad state already absorbed; copied per signature.
+        # None without a secret, so requests fail clearly (see _get_signature)
+        self._hmac_proto = (
+            hmac.new(self.secret_key.encode(), digestmod=hashlib.sha256) if self.secret_key else None
+        )
+        
         self.subscriptions: Dict[str, List[Callable]] = {}
+        
+        # Cached symbol catalog, see _load_symbols:
+        # (monotonic fetch time, rules by symbol, online symbols, same as a set)
+        self._symbols_cache: Optional[Tuple[float, Dict[str, Any], List[str], FrozenSet[str]]] = None
+        self._symbols_lock = asyncio.Lock()
+        # symbol -> (price scale, quantity scale), filled by _load_symbols; orders
+        # load it on first use (see _order_payload)
+        self._scales: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+        
+        # LLM callbacks run on a background task, off the request path
+        self._llm_events = LLMEventQueue(self.emit_llm_event, _CALLBACK_QUEUE_SIZE)
 
     async def __aenter__(self):
         self.session = aiohttp.ClientSession()
@@ -105,25 +176,33 @@ class BitgetAPI(BaseExchange):
 
     async def close(self):
         try:
-            for conn in self.ws_connections.values():
-                await conn.close()
+            await self._llm_events.close()
+            # Dropping subscriptions lets _maintain_ws exit instead of reconnecting
+            self.subscriptions.clear()
+            await asyncio.gather(
+                *(conn.close() for conn in self.ws_connections.values() if conn is not None),
+                return_exceptions=True
+            )
+            self.ws_connections.clear()
             if self.session and not self.session.closed:
                 await self.session.close()
             logger.info("Bitget API client closed successfully")
         except Exception as e:
             logger.error(f"Error closing Bitget client: {e}")
 
+    def _emit_llm_callback(self, event: str, payload: Dict[str, Any]) -> None:
+        """Queue an LLM event without waiting for callbacks to run"""
+        if not self.llm_callbacks.get(event):
+            return
+        self._llm_events.put(event, payload)
+
     def _get_signature(self, timestamp: str, method: str, path: str, body: str = "") -> str:
         """Generate HMAC SHA256 signature"""
-        message = f"{timestamp}{method}{path}{body}"
-        
-        signature = hmac.new(
-            self.secret_key.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).digest()
-        
-        return base64.b64encode(signature).decode()
+        if self._hmac_proto is None:
+            raise ValueError("Bitget secret key is required for signed requests")
+        mac = self._hmac_proto.copy()
+        mac.update(f"{timestamp}{method}{path}{body}".encode())
+        return base64.b64encode(mac.digest()).decode()
 
     async def _request(
         self,
@@ -138,24 +217,20 @@ class BitgetAPI(BaseExchange):
         
         await self.rate_limiter.acquire()
         
-        url = f"{self.rest_base}{endpoint}"
+        url = self._urls.get(endpoint) or f"{self.rest_base}{endpoint}"
         timestamp = str(int(time.time() * 1000))
         
         body = json.dumps(data) if data else ""
         signature = self._get_signature(timestamp, method, endpoint, body)
         
-        headers = {
-            "ACCESS-KEY": self.api_key,
-            "ACCESS-SIGN": signature,
-            "ACCESS-TIMESTAMP": timestamp,
-            "ACCESS-PASSPHRASE": self.passphrase,
-            "Content-Type": "application/json"
-        }
+        headers = {**self._header_tmpl, "ACCESS-SIGN": signature, "ACCESS-TIMESTAMP": timestamp}
         
         max_retries = 3
-        retry_count = 0
+        delay = _RETRY_BASE
+        idempotent = method == "GET"
         
-        while retry_count < max_retries:
+        for attempt in range(max_retries):
+            is_last = attempt == max_retries - 1
             try:
                 async with self.session.request(
                     method,
@@ -165,31 +240,46 @@ class BitgetAPI(BaseExchange):
                     headers=headers,
                     timeout=aiohttp.ClientTimeout(total=10)
                 ) as response:
-                    result = await response.json()
+                    result = json_loads(await response.read())
+                    code = result.get("code")
                     
-                    if result.get("code") == "00000":
-                        await self._emit_llm_callback("on_market_data", {
+                    if code == "00000":
+                        self._emit_llm_callback("on_market_data", {
                             "exchange": "bitget",
                             "endpoint": endpoint,
                             "timestamp": datetime.utcnow().isoformat()
                         })
                         return result.get("data", result)
-                    elif result.get("code") == "40429":
-                        await asyncio.sleep(2 ** retry_count)
-                        retry_count += 1
-                    else:
+                    if code != "40429":
                         raise Exception(f"API Error: {result.get('msg', 'Unknown')}")
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= max_retries:
+                    if is_last:
+                        break
+                    
+                    delay = min(_RETRY_CAP, random.uniform(_RETRY_BASE, delay * 3))
+                    wait_time = retry_after(response.headers.get("Retry-After"), delay)
+                    logger.warning(
+                        f"Bitget rate limit on {endpoint}. Waiting {wait_time:.2f}s "
+                        f"before retry {attempt + 1}/{max_retries - 1}"
+                    )
+            except _RETRYABLE_ERRORS as e:
+                # Only a failed connect proves a non-GET request was never sent
+                if is_last or not (idempotent or isinstance(e, aiohttp.ClientConnectorError)):
                     raise
-                await asyncio.sleep(2 ** retry_count)
+                # A dropped connection usually succeeds straight away; jitter after that
+                if attempt == 0:
+                    wait_time = 0.0
+                else:
+                    delay = min(_RETRY_CAP, random.uniform(_RETRY_BASE, delay * 3))
+                    wait_time = delay
+                logger.warning(f"Bitget request to {endpoint} failed ({e!r}). Retrying in {wait_time:.2f}s")
+            
+            await asyncio.sleep(wait_time)
         
         raise Exception("Max retries exceeded")
 
     async def get_price(self, symbol: str) -> float:
         """Get current price"""
-        data = await self._request("GET", f"/api/v2/spot/ticker", {"symbol": symbol})
+        data = await self._request("GET", _EP_TICKER, {"symbol": symbol})
         
         if isinstance(data, list) and len(data) > 0:
             return float(data[0].get("lastPr", 0))
@@ -198,7 +288,7 @@ class BitgetAPI(BaseExchange):
 
     async def get_ticker(self, symbol: str) -> Ticker:
         """Get 24-hour ticker"""
-        data = await self._request("GET", "/api/v2/spot/ticker", {"symbol": symbol})
+        data = await self._request("GET", _EP_TICKER, {"symbol": symbol})
         
         ticker_data = data[0] if isinstance(data, list) and len(data) > 0 else data
         
@@ -213,7 +303,7 @@ class BitgetAPI(BaseExchange):
             timestamp=datetime.utcnow()
         )
         
-        await self._emit_llm_callback("on_ticker_update", {
+        self._emit_llm_callback("on_ticker_update", {
             "symbol": symbol,
             "last_price": ticker.last_price,
             "volume_24h": ticker.volume_24h
@@ -230,7 +320,7 @@ class BitgetAPI(BaseExchange):
         """Get historical OHLCV data"""
         data = await self._request(
             "GET",
-            "/api/v2/spot/candles",
+            _EP_CANDLES,
             {
                 "symbol": symbol,
                 "granularity": timeframe,
@@ -254,25 +344,36 @@ class BitgetAPI(BaseExchange):
         
         return ohlcvs
 
-    async def place_order(self, order: Order) -> Dict[str, Any]:
-        """Place order"""
+    async def _order_payload(self, order: Order) -> Dict[str, Any]:
+        """Build an order payload at the symbol's precision
+        
+        The symbol catalog is loaded on first use (see _load_symbols), so a
+        fresh client truncates sizes too instead of sending str(float).
+        """
+        if order.symbol not in self._scales:
+            await self._load_symbols()
+        price_scale, qty_scale = self._scales.get(order.symbol, (None, None))
         order_data = {
             "symbol": order.symbol,
             "side": order.side.value.lower(),
             "orderType": "limit" if order.price else "market",
-            "size": str(order.quantity),
+            "size": format_quantity(order.quantity, qty_scale),
         }
-        
         if order.price:
-            order_data["price"] = str(order.price)
+            order_data["price"] = format_decimal(order.price, price_scale)
+        return order_data
+
+    async def place_order(self, order: Order) -> Dict[str, Any]:
+        """Place order"""
+        order_data = await self._order_payload(order)
         
         response = await self._request(
             "POST",
-            "/api/v2/spot/orders",
+            _EP_ORDERS,
             data=order_data
         )
         
-        await self._emit_llm_callback("on_order", {
+        self._emit_llm_callback("on_order", {
             "exchange": "bitget",
             "action": "place",
             "symbol": order.symbol,
@@ -288,14 +389,14 @@ class BitgetAPI(BaseExchange):
         """Cancel order"""
         response = await self._request(
             "POST",
-            "/api/v2/spot/cancel-order",
+            _EP_CANCEL_ORDER,
             data={
                 "symbol": symbol,
                 "orderId": order_id
             }
         )
         
-        await self._emit_llm_callback("on_order", {
+        self._emit_llm_callback("on_order", {
             "exchange": "bitget",
             "action": "cancel",
             "order_id": order_id,
@@ -309,7 +410,7 @@ class BitgetAPI(BaseExchange):
         """Get order details"""
         return await self._request(
             "GET",
-            "/api/v2/spot/order-info",
+            _EP_ORDER_INFO,
             {"symbol": symbol, "orderId": order_id}
         )
 
@@ -319,7 +420,7 @@ class BitgetAPI(BaseExchange):
         if symbol:
             params["symbol"] = symbol
         
-        data = await self._request("GET", "/api/v2/spot/open-orders", params)
+        data = await self._request("GET", _EP_OPEN_ORDERS, params)
         return data if isinstance(data, list) else []
 
     async def get_balance(self, asset: str) -> Dict[str, float]:
@@ -340,7 +441,7 @@ class BitgetAPI(BaseExchange):
         """Get order book"""
         return await self._request(
             "GET",
-            "/api/v2/spot/order-book",
+            _EP_ORDER_BOOK,
             {"symbol": symbol, "limit": depth}
         )
 
@@ -382,67 +483,67 @@ class BitgetAPI(BaseExchange):
         return {}
     async def subscribe_ticker(self, symbol: str, callback: Callable) -> None:
         """Subscribe to ticker updates"""
-        stream_name = f"ticker.{symbol}"
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
-        self.subscriptions[stream_name].append(callback)
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
+        self._ensure_subscription(f"ticker.{symbol}", callback)
 
     async def subscribe_trades(self, symbol: str, callback: Callable) -> None:
         """Subscribe to trades"""
-        stream_name = f"trades.{symbol}"
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
-        self.subscriptions[stream_name].append(callback)
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
+        self._ensure_subscription(f"trades.{symbol}", callback)
 
     async def subscribe_order_book(self, symbol: str, callback: Callable, depth: int = 20) -> None:
         """Subscribe to order book"""
-        stream_name = f"orderbook.{depth}.{symbol}"
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
-        self.subscriptions[stream_name].append(callback)
+        self._ensure_subscription(f"orderbook.{depth}.{symbol}", callback)
+
+    def _ensure_subscription(self, stream_name: str, callback: Callable) -> None:
+        """Register callback and start the stream task for its first subscriber
+        
+        The None placeholder in ws_connections is claimed before any await,
+        so concurrent subscribers never spawn a second task for one stream.
+        """
+        self.subscriptions.setdefault(stream_name, []).append(callback)
         if stream_name not in self.ws_connections:
+            self.ws_connections[stream_name] = None
             asyncio.create_task(self._maintain_ws(stream_name))
 
     async def _maintain_ws(self, stream_name: str) -> None:
-        """Maintain WebSocket connection"""
+        """Maintain WebSocket connection
+        
+        Runs on the client's shared session so reconnects reuse its connector
+        and DNS cache; the subscribe frame is built once per stream.
+        """
         reconnect_delay = 1
         max_reconnect_delay = 60
         
+        channel = stream_name.split(".")[0]
+        symbol = stream_name.split(".")[-1]
+        subscribe_msg = {
+            "op": "subscribe",
+            "args": [{
+                "instType": "sp",
+                "channel": channel,
+                "instId": symbol
+            }]
+        }
+        
         while stream_name in self.subscriptions:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.ws_connect(self.ws_base) as ws:
-                        self.ws_connections[stream_name] = ws
-                        reconnect_delay = 1
-                        
-                        channel = stream_name.split(".")[0]
-                        symbol = stream_name.split(".")[-1]
-                        
-                        subscribe_msg = {
-                            "op": "subscribe",
-                            "args": [{
-                                "instType": "sp",
-                                "channel": channel,
-                                "instId": symbol
-                            }]
-                        }
-                        await ws.send_json(subscribe_msg)
-                        logger.info(f"WebSocket connected: {stream_name}")
-                        
-                        async for msg in ws:
-                            if msg.type == aiohttp.WSMsgType.TEXT:
-                                data = json.loads(msg.data)
-                                await self._process_ws_message(stream_name, data)
-                            elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
-                                break
+                if self.session is None or self.session.closed:
+                    self.session = aiohttp.ClientSession()
+                async with self.session.ws_connect(self.ws_base) as ws:
+                    self.ws_connections[stream_name] = ws
+                    reconnect_delay = 1
+                    
+                    await ws.send_str(json_dumps_str(subscribe_msg))
+                    logger.info(f"WebSocket connected: {stream_name}")
+                    
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            data = json_loads(msg.data)
+                            await self._process_ws_message(stream_name, data)
+                        elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
+                            break
             except Exception as e:
                 logger.error(f"WebSocket error ({stream_name}): {e}")
-                if stream_name in self.ws_connections:
-                    del self.ws_connections[stream_name]
+                self.ws_connections[stream_name] = None
                 await asyncio.sleep(reconnect_delay)
                 reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
 
@@ -470,22 +571,56 @@ class BitgetAPI(BaseExchange):
         return data if isinstance(data, list) else []
 
     async def get_trading_rules(self) -> Dict[str, Any]:
-        """Get trading rules"""
-        data = await self._request("GET", "/api/v2/spot/symbols")
-        rules_by_symbol = {}
-        symbols_list = data if isinstance(data, list) else []
-        for symbol_info in symbols_list:
-            symbol = symbol_info.get("symbol")
-            rules_by_symbol[symbol] = {
-                "baseAsset": symbol_info.get("baseCoin"),
-                "quoteAsset": symbol_info.get("quoteCoin"),
-                "status": symbol_info.get("status"),
-                "filters": {
-                    "minPrice": symbol_info.get("priceScale"),
-                    "minQty": symbol_info.get("quantityScale")
+        """Get trading rules (cached for _RULES_TTL seconds)
+        
+        Returns a copy, so callers may modify it without touching the cache.
+        """
+        return copy.deepcopy((await self._load_symbols())[1])
+
+    async def _load_symbols(self) -> Tuple[float, Dict[str, Any], List[str], FrozenSet[str]]:
+        """Return the symbol catalog, refetching it once _RULES_TTL has passed
+        
+        Trading rules, online symbols and order scales are all built from one
+        _EP_SYMBOLS response, so they share one request and one TTL clock.
+        """
+        cache = self._symbols_cache
+        if cache and time.monotonic() - cache[0] < _RULES_TTL:
+            return cache
+        
+        async with self._symbols_lock:
+            # Another caller may have refreshed it while we waited
+            cache = self._symbols_cache
+            if cache and time.monotonic() - cache[0] < _RULES_TTL:
+                return cache
+            
+            data = await self._request("GET", _EP_SYMBOLS)
+            symbols_list = data if isinstance(data, list) else []
+            rules_by_symbol = {
+                symbol_info.get("symbol"): {
+                    "baseAsset": symbol_info.get("baseCoin"),
+                    "quoteAsset": symbol_info.get("quoteCoin"),
+                    "status": symbol_info.get("status"),
+                    "filters": {
+                        "minPrice": symbol_info.get("priceScale"),
+                        "minQty": symbol_info.get("quantityScale")
+                    }
                 }
+                for symbol_info in symbols_list
             }
-        return rules_by_symbol
+            online = [
+                symbol_info.get("symbol")
+                for symbol_info in symbols_list
+                if symbol_info.get("status") == "online"
+            ]
+            self._scales = {
+                symbol_info.get("symbol"): (
+                    _to_scale(symbol_info.get("priceScale")),
+                    _to_scale(symbol_info.get("quantityScale"))
+                )
+                for symbol_info in symbols_list
+            }
+            self._symbols_cache = (time.monotonic(), rules_by_symbol, online, frozenset(online))
+            return self._symbols_cache
 
     async def estimate_fee(self, symbol: str, quantity: float, price: float) -> Dict[str, float]:
         """Estimate fees"""
@@ -501,10 +636,9 @@ class BitgetAPI(BaseExchange):
         }
 
     async def validate_symbol(self, symbol: str) -> bool:
-        """Validate symbol"""
+        """Validate symbol against the cached set of online symbols"""
         try:
-            await self.get_price(symbol)
-            return True
+            return symbol in await self._online_symbols()
         except Exception:
             return False
 
@@ -520,14 +654,12 @@ class BitgetAPI(BaseExchange):
         return await self._request("GET", "/api/v2/mix/positions")
 
     async def get_available_symbols(self) -> List[str]:
-        """Get available symbols"""
-        data = await self._request("GET", "/api/v2/spot/symbols")
-        symbols = []
-        symbols_list = data if isinstance(data, list) else []
-        for symbol_info in symbols_list:
-            if symbol_info.get("status") == "online":
-                symbols.append(symbol_info.get("symbol"))
-        return symbols
+        """Get available symbols (cached for _RULES_TTL seconds)"""
+        return list((await self._load_symbols())[2])
+
+    async def _online_symbols(self) -> FrozenSet[str]:
+        """Return the online symbol set from the cached catalog"""
+        return (await self._load_symbols())[3]
 
     async def amend_order(self, order_id: str, symbol: str, qty: Optional[float] = None, price: Optional[float] = None) -> Dict[str, Any]:
         """Amend order"""
@@ -536,7 +668,7 @@ class BitgetAPI(BaseExchange):
             data["newSize"] = str(qty)
         if price:
             data["newPrice"] = str(price)
-        return await self._request("POST", "/api/v2/spot/amend-order", data=data)
+        return await self._request("POST", _EP_AMEND_ORDER, data=data)
 
     async def get_account_info(self) -> Dict[str, Any]:
         """Get account info"""
@@ -609,16 +741,8 @@ class BitgetAPI(BaseExchange):
 
     async def batch_orders(self, orders: List[Order]) -> List[Dict]:
         """Place multiple orders"""
-        order_list = []
-        for order in orders:
-            order_list.append({
-                "symbol": order.symbol,
-                "side": order.side.value.lower(),
-                "orderType": "limit" if order.price else "market",
-                "size": str(order.quantity),
-                "price": str(order.price) if order.price else None
-            })
-        return await self._request("POST", "/api/v2/spot/batch-orders", data=order_list)
+        order_list = [await self._order_payload(order) for order in orders]
+        return await self._request("POST", _EP_BATCH_ORDERS, data=order_list)
 
     def __repr__(self) -> str:
         return (
@@ -12,23 +12,81 @@ Provides unified interface for Bybit spot, futures, and perpetuals trading with:
 import asyncio
 import hashlib
 import hmac
-import json
 import logging
 import os
 import time
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+from urllib.parse import quote, urlencode
 
 import aiohttp
+from yarl import URL
+
+if TYPE_CHECKING:
+    # numpy/pandas are only needed by the columnar history getters; imported there
+    import numpy as np
+    import pandas as pd
 
 from .base_exchange import (
     BaseExchange, Order, OrderType, Side, OrderStatus,
-    Ticker, OHLCV, RateLimiter
+    Ticker, OHLCV, TokenBucket,
+    format_decimal, format_quantity, json_dumps, json_dumps_str, json_loads, retry_after
 )
 
 logger = logging.getLogger(__name__)
 
+# Validity window (ms) sent with, and signed into, every authenticated request
+_RECV_WINDOW = "5000"
+_RECV_WINDOW_BYTES = _RECV_WINDOW.encode()
+
+# Connection-level failures worth retrying (timeouts are handled separately)
+_RETRYABLE_ERRORS = (
+    aiohttp.ClientConnectorError,
+    aiohttp.ServerDisconnectedError,
+    aiohttp.ClientPayloadError,
+    ConnectionResetError,
+)
+
+
+def _step_decimals(step: Any) -> Optional[int]:
+    """Decimal places of a Bybit tickSize/qtyStep string ('0.010' -> 2)"""
+    if not step:
+        return None
+    return len(str(step).rstrip("0").partition(".")[2])
+
+
+def _instrument_decimals(symbol_info: Dict[str, Any]) -> Tuple[Optional[int], Optional[int]]:
+    """(price decimals, qty decimals) of an instruments-info row"""
+    lot_filter = symbol_info.get("lotSizeFilter", {})
+    # Derivatives publish qtyStep, spot basePrecision
+    return (
+        _step_decimals(symbol_info.get("priceFilter", {}).get("tickSize")),
+        _step_decimals(lot_filter.get("qtyStep") or lot_filter.get("basePrecision"))
+    )
+
+
+# Bybit accepts at most 10 topics per public subscribe request
+_WS_MAX_ARGS = 10
+
+# How long (seconds) the instruments-info symbol list is served from cache
+_SYMBOLS_TTL = 60.0
+
+# Fee rates only change with VIP tier; cache them this long (seconds)
+_FEE_TTL = 300.0
+
+# Position rows are reused this long (seconds) across back-to-back risk checks
+_POSITION_TTL = 0.5
+
+# How long (seconds) a get_all_tickers pull also answers per-symbol price reads
+_TICKERS_TTL = 0.5
+
+# Re-sync the server clock offset after this many seconds (see get_server_time)
+_TIME_SYNC_TTL = 60.0
+
+# Per-request REST timeout; kept off the session so it can't cut long-lived WS streams
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 
 class BybitOrderType(Enum):
     """Bybit-specific order types"""
@@ -117,18 +175,94 @@ class BybitAPI(BaseExchange):
             self.rest_base = "https://api.bybit.com/v5"
             self.ws_base = "wss://stream.bybit.com/v5"
         
-        # Rate limiter: 120 requests/minute for free tier
-        self.rate_limiter = RateLimiter(max_requests=120, window_seconds=60)
-        
-        # WebSocket subscriptions
-        self.subscriptions: Dict[str, List[Callable]] = {}
+        # Rate limiter: 120 requests/minute for free tier, bursts of up to 20;
+        # the semaphore caps how many requests are in flight at once
+        self.rate_limiter = TokenBucket(capacity=20, refill_per_sec=120 / 60)
+        self._request_slots = asyncio.Semaphore(20)
+        
+        # WebSocket subscriptions, all served by one public connection
+        # Callbacks are immutable tuples: subscribe is rare, dispatch is hot
+        self.subscriptions: Dict[str, Tuple[Callable, ...]] = {}
+        self._public_ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._public_ws_task: Optional[asyncio.Task] = None
+        self._ws_lock = asyncio.Lock()
+        # Topics subscribed on a live socket within one loop tick go out as one frame
+        self._pending_subs: List[str] = []
+        self._sub_flush_handle: Optional[asyncio.Handle] = None
+        self._sub_tasks: Set[asyncio.Task] = set()
         self.position_mode = BybitPositionMode.ONE_WAY
+        
+        # Mode-derived request constants, resolved once instead of per call
+        self._is_spot = trading_type == BybitTradingType.SPOT
+        if self._is_spot:
+            self._category = "spot"
+        elif trading_type == BybitTradingType.LINEAR_FUTURES:
+            self._category = "linear"
+        else:
+            self._category = "inverse"
+        self._account_type = "SPOT" if self._is_spot else "CONTRACT"
+        self._ws_public_url = f"{self.ws_base}/public/{self._category}"
+        # Latest-candle kline query shared by get_mark_price/get_index_price
+        self._last_kline_params = {"category": self._category, "interval": "1", "limit": 1}
+        self._poll_params_cache: Dict[Tuple[str, str, Optional[int]], Dict[str, Any]] = {}
+        # (fetched_at, tradeable symbols, same as a set), see _tradeable_symbols
+        self._symbols_cache: Optional[Tuple[float, List[str], FrozenSet[str]]] = None
+        # symbol -> (expires_at, maker rate, taker rate), see get_fee_rates
+        self._fee_cache: Dict[str, Tuple[float, float, float]] = {}
+        # symbol -> (price decimals, qty decimals), filled by get_trading_rules
+        # or per symbol on first use (see _symbol_decimals)
+        self._decimals: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+        self._vip_level: Optional[str] = None
+        # (monotonic time at sync, server ms at sync), see get_server_time
+        self._time_sync: Optional[Tuple[float, int]] = None
+        # symbol -> (fetched_at, position row), see _position_row
+        self._position_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # symbol -> latest tickers.* fields, filled by start_ticker_stream
+        self._ticker_cache: Dict[str, Dict[str, Any]] = {}
+        # (fetched_at, symbol -> ticker row), see get_all_tickers
+        self._all_tickers_cache: Optional[Tuple[float, Dict[str, Dict[str, Any]]]] = None
+        
+        # In-flight LLM callback tasks (see _schedule_llm_callback)
+        self._llm_tasks: Set[asyncio.Task] = set()
+        
+        # Second-resolution ISO timestamp for LLM payloads (see _iso_now)
+        self._iso_cache_t = 0
+        self._iso_cache_s = ""
+        
+        # Keyed HMAC prototype; copying it skips key setup on every signature.
+        # None without a secret, so signed calls fail clearly (see _get_signature)
+        self._api_key_bytes = (self.api_key or "").encode()
+        self._hmac_template = (
+            hmac.new(self.secret_key.encode(), b"", hashlib.sha256) if self.secret_key else None
+        )
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        await self.connect()
         return self
 
+    async def connect(self) -> None:
+        """Open the shared session; await once before use outside ``async with``
+        
+        Every method is a coroutine on this session, so calls from other
+        tasks on the same loop overlap their network round-trips.
+        """
+        if self.session is None or self.session.closed:
+            self.session = self._new_session()
+            self.invalidate_symbols()
+
+    @staticmethod
+    def _new_session() -> aiohttp.ClientSession:
+        """Create the shared REST/WS session with a keep-alive connection pool"""
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            keepalive_timeout=90,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(connector=connector)
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         await self.close()
@@ -136,28 +270,71 @@ class BybitAPI(BaseExchange):
     async def close(self):
         """Gracefully close all connections"""
         try:
-            for conn in self.ws_connections.values():
-                await conn.close()
+            # Dropping subscriptions stops _maintain_ws from reconnecting
+            self.subscriptions.clear()
+            self._pending_subs.clear()
+            if self._sub_flush_handle is not None:
+                self._sub_flush_handle.cancel()
+                self._sub_flush_handle = None
+            # Snapshot: _maintain_public_ws pops its entry while the socket closes
+            await asyncio.gather(
+                *(conn.close() for conn in list(self.ws_connections.values())),
+                return_exceptions=True
+            )
+            self.ws_connections.clear()
+            tasks = [
+                task for task in (self._public_ws_task, *self._sub_tasks, *self._llm_tasks)
+                if task is not None
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._public_ws_task = None
+            self._sub_tasks.clear()
+            self._llm_tasks.clear()
             if self.session and not self.session.closed:
                 await self.session.close()
             logger.info("Bybit API client closed successfully")
         except Exception as e:
             logger.error(f"Error closing Bybit client: {e}")
 
-    def _get_signature(self, query_string: str) -> str:
+    def _schedule_llm_callback(self, event: str, payload: Dict[str, Any]) -> None:
+        """Fire an LLM event in the background so callers never wait on it"""
+        if not self.llm_callbacks.get(event):
+            return
+        task = asyncio.create_task(self._emit_llm_callback(event, payload))
+        # Hold a reference until done so the task isn't garbage-collected mid-run
+        self._llm_tasks.add(task)
+        task.add_done_callback(self._llm_tasks.discard)
+
+    async def _emit_llm_callback(self, event: str, payload: Dict[str, Any]) -> None:
+        """Deliver an LLM event to its registered callbacks"""
+        await self.emit_llm_event(event, payload)
+
+    def _iso_now(self) -> str:
+        """Current UTC time as ISO-8601, re-formatted at most once per second"""
+        now = int(time.time())
+        if now != self._iso_cache_t:
+            self._iso_cache_s = datetime.utcfromtimestamp(now).isoformat()
+            self._iso_cache_t = now
+        return self._iso_cache_s
+
+    def _get_signature(self, payload: bytes) -> str:
         """Generate HMAC SHA256 signature for request
         
         Args:
-            query_string: Query parameters and timestamp
+            payload: timestamp + api_key + recv_window + (query string | body)
             
         Returns:
             Hex-encoded signature
         """
-        return hmac.new(
-            self.secret_key.encode(),
-            query_string.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        if self._hmac_template is None:
+            raise ValueError("Bybit secret key is required for signed requests")
+        # Copying the pre-keyed template skips the key schedule; it measures
+        # faster than the one-shot hmac.digest() for payloads this size
+        mac = self._hmac_template.copy()
+        mac.update(payload)
+        return mac.hexdigest()
 
     async def _request(
         self,
@@ -185,97 +362,154 @@ class BybitAPI(BaseExchange):
         if params is None:
             params = {}
         
-        # Apply rate limiting
-        await self.rate_limiter.acquire()
+        # Lazily open the pooled session so clients used without `async with`
+        # or connect() still reuse keep-alive connections across calls
+        if self.session is None or self.session.closed:
+            await self.connect()
         
-        # Build URL
+        # Build URL; the query string is encoded once and signed as sent
         url = f"{self.rest_base}/{endpoint}"
+        query_string = urlencode(sorted(params.items()), quote_via=quote)
+        if query_string:
+            # encoded=True stops yarl from re-quoting what was signed
+            url = URL(f"{url}?{query_string}", encoded=True)
+        
+        # Serialize the body once; aiohttp sends these exact (signed) bytes
+        body = json_dumps(data) if data else None
+        
         headers = {
             "X-BAPI-API-KEY": self.api_key,
             "Content-Type": "application/json"
         }
         
         if signed:
-            timestamp = str(int(time.time() * 1000))
-            
-            # Build query string for signature
-            if params:
-                query_string = "&".join(
-                    f"{k}={v}" for k, v in sorted(params.items())
-                )
-                signature_payload = query_string + timestamp
-            else:
-                signature_payload = timestamp
+            timestamp = str(time.time_ns() // 1_000_000)
             
-            if data:
-                data_str = json.dumps(data)
-                signature_payload = data_str + timestamp
-            
-            signature = self._get_signature(signature_payload)
+            # Bybit v5: timestamp + api_key + recv_window + (body | query string)
+            signature_payload = b"".join((
+                timestamp.encode(),
+                self._api_key_bytes,
+                _RECV_WINDOW_BYTES,
+                body if body is not None else query_string.encode()
+            ))
             
             headers["X-BAPI-TIMESTAMP"] = timestamp
-            headers["X-BAPI-SIGN"] = signature
+            headers["X-BAPI-RECV-WINDOW"] = _RECV_WINDOW
+            headers["X-BAPI-SIGN"] = self._get_signature(signature_payload)
         
         max_retries = 3
         retry_count = 0
         backoff_base = 2
+        # A timeout or dropped connection can hide an order that was already
+        # placed, so only GETs are resent after one; other methods are retried
+        # only when the connect itself failed, or when Bybit rate-limited them
+        idempotent = method == "GET"
         
         while retry_count < max_retries:
+            # Set when rate limited; slept off after the request slot is released
+            wait_time = None
             try:
-                async with self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    json=data,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    result = await response.json()
-                    
-                    # Check Bybit's status code in response body
-                    if result.get("retCode") == 0:
-                        # Emit LLM callback
-                        await self._emit_llm_callback("on_market_data", {
-                            "exchange": "bybit",
-                            "trading_mode": self.trading_type.value,
-                            "endpoint": endpoint,
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
-                        return result.get("result", result)
-                    
-                    elif result.get("retCode") == 110001:  # Rate limit
-                        wait_time = backoff_base ** retry_count
-                        logger.warning(
-                            f"Bybit rate limit. Waiting {wait_time}s "
-                            f"before retry {retry_count + 1}/{max_retries}"
-                        )
-                        await asyncio.sleep(wait_time)
-                        retry_count += 1
-                    
-                    else:
-                        error_msg = result.get("retMsg", "Unknown error")
-                        logger.error(f"Bybit API Error: {error_msg}")
-                        raise Exception(f"API Error: {error_msg}")
+                # Bounded concurrency, then a rate-limit token per attempt
+                async with self._request_slots:
+                    await self.rate_limiter.acquire()
+                    async with self.session.request(
+                        method,
+                        url,
+                        data=body,
+                        headers=headers,
+                        timeout=_REQUEST_TIMEOUT
+                    ) as response:
+                        if response.status == 429:
+                            wait_time = retry_after(
+                                response.headers.get("Retry-After"),
+                                backoff_base ** retry_count
+                            )
+                            logger.warning(
+                                f"Bybit HTTP 429. Waiting {wait_time}s "
+                                f"before retry {retry_count + 1}/{max_retries}"
+                            )
+                            response.release()
+                        else:
+                            result = json_loads(await response.read())
+                            
+                            # Check Bybit's status code in response body
+                            if result.get("retCode") == 0:
+                                # Emit LLM callback; the payload is built only when consumed
+                                # and is fresh per event, since callbacks run as later tasks
+                                if self.llm_callbacks.get("on_market_data"):
+                                    self._schedule_llm_callback("on_market_data", {
+                                        "exchange": "bybit",
+                                        "trading_mode": self.trading_type.value,
+                                        "endpoint": endpoint,
+                                        "timestamp": self._iso_now()
+                                    })
+                                # v5 success payloads are always {"result": {...}}; list
+                                # endpoints nest rows under result["list"]
+                                return result.get("result") or {}
+                            
+                            elif result.get("retCode") == 110001:  # Rate limit
+                                wait_time = backoff_base ** retry_count
+                                logger.warning(
+                                    f"Bybit rate limit. Waiting {wait_time}s "
+                                    f"before retry {retry_count + 1}/{max_retries}"
+                                )
+                            
+                            else:
+                                if result.get("retCode") == 10002:
+                                    # Timestamp outside recv_window: the cached clock may have drifted
+                                    self._time_sync = None
+                                error_msg = result.get("retMsg", "Unknown error")
+                                logger.error(f"Bybit API Error: {error_msg}")
+                                raise Exception(f"API Error: {error_msg}")
             
             except asyncio.TimeoutError:
+                if not idempotent:
+                    raise
                 retry_count += 1
                 if retry_count < max_retries:
-                    wait_time = backoff_base ** retry_count
-                    logger.warning(f"Request timeout. Retrying in {wait_time}s")
-                    await asyncio.sleep(wait_time)
+                    delay = backoff_base ** retry_count
+                    logger.warning(f"Request timeout. Retrying in {delay}s")
+                    await asyncio.sleep(delay)
                 else:
                     raise Exception("Request timeout after max retries")
             
-            except Exception as e:
-                logger.error(f"Request failed: {e}")
-                if retry_count < max_retries - 1:
+            except _RETRYABLE_ERRORS as e:
+                # Transport failures only; API errors and cancellation propagate
+                logger.error(f"Request failed: {e!r}")
+                if retry_count < max_retries - 1 and (
+                    idempotent or isinstance(e, aiohttp.ClientConnectorError)
+                ):
                     retry_count += 1
                     await asyncio.sleep(backoff_base ** retry_count)
                 else:
                     raise
+            
+            if wait_time is not None:
+                # Back off outside the slot; the next attempt takes a fresh token
+                await asyncio.sleep(wait_time)
+                retry_count += 1
         
         raise Exception("Max retries exceeded")
 
+    @staticmethod
+    def _rows(data: Dict[str, Any]) -> List[Any]:
+        """Rows of a v5 list response; _request always returns the result dict"""
+        return data.get("list") or []
+
+    def _poll_params(self, endpoint: str, symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Query params for hot market-data polls, built once per key
+        
+        The returned dict is shared across calls and must not be mutated.
+        """
+        key = (endpoint, symbol, limit)
+        params = self._poll_params_cache.get(key)
+        if params is None:
+            params = {"category": self._category, "symbol": symbol}
+            if limit is not None:
+                params["limit"] = limit
+            self._poll_params_cache[key] = params
+        return params
+
     async def get_price(self, symbol: str) -> float:
         """Get current market price for symbol
         
@@ -285,24 +519,27 @@ class BybitAPI(BaseExchange):
         Returns:
             Current price as float
             
+        Raises:
+            ValueError: If Bybit has no ticker for symbol
+            
         Example:
             >>> price = await client.get_price("BTCUSDT")
             >>> print(f"${price}")
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
+        cached = self._cached_ticker(symbol)
+        if cached is not None and "lastPrice" in cached:
+            return float(cached["lastPrice"])
         
         data = await self._request(
             "GET",
             "market/tickers",
-            {"category": category, "symbol": symbol}
+            self._poll_params("market/tickers", symbol)
         )
         
-        if isinstance(data, dict) and "list" in data:
-            ticker = data["list"][0] if data["list"] else {}
-        else:
-            ticker = data[0] if isinstance(data, list) else {}
-        
-        return float(ticker.get("lastPrice", 0))
+        tickers = self._rows(data)
+        if not tickers:
+            raise ValueError(f"Bybit returned no ticker for {symbol} ({self._category})")
+        return float(tickers[0].get("lastPrice", 0))
 
     async def get_ticker(self, symbol: str) -> Ticker:
         """Get 24-hour ticker data
@@ -312,16 +549,20 @@ class BybitAPI(BaseExchange):
             
         Returns:
             Ticker object with OHLCV data
+            
+        Raises:
+            ValueError: If Bybit has no ticker for symbol
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         data = await self._request(
             "GET",
             "market/tickers",
-            {"category": category, "symbol": symbol}
+            self._poll_params("market/tickers", symbol)
         )
         
-        ticker_data = data["list"][0] if isinstance(data, dict) and data.get("list") else data[0]
+        tickers = self._rows(data)
+        if not tickers:
+            raise ValueError(f"Bybit returned no ticker for {symbol} ({self._category})")
+        ticker_data = tickers[0]
         
         ticker = Ticker(
             symbol=symbol,
@@ -334,12 +575,13 @@ class BybitAPI(BaseExchange):
             timestamp=datetime.utcnow()
         )
         
-        # Emit LLM callback
-        await self._emit_llm_callback("on_ticker_update", {
-            "symbol": symbol,
-            "last_price": ticker.last_price,
-            "volume_24h": ticker.volume_24h
-        })
+        # Emit LLM callback (fresh payload: the callback runs as a later task)
+        if self.llm_callbacks.get("on_ticker_update"):
+            self._schedule_llm_callback("on_ticker_update", {
+                "symbol": symbol,
+                "last_price": ticker.last_price,
+                "volume_24h": ticker.volume_24h
+            })
         
         return ticker
 
@@ -359,34 +601,101 @@ class BybitAPI(BaseExchange):
         Returns:
             List of OHLCV objects
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         data = await self._request(
             "GET",
             "market/kline",
             {
-                "category": category,
+                "category": self._category,
                 "symbol": symbol,
                 "interval": timeframe,
                 "limit": min(limit, 1000)
             }
         )
         
-        ohlcvs = []
-        candles = data.get("list", []) if isinstance(data, dict) else data
+        candles = self._rows(data)
         
-        for candle in candles:
-            ohlcv = OHLCV(
-                timestamp=datetime.fromtimestamp(int(candle[0]) / 1000),
+        return [
+            OHLCV(
+                timestamp=datetime.utcfromtimestamp(int(candle[0]) * 0.001),
                 open=float(candle[1]),
                 high=float(candle[2]),
                 low=float(candle[3]),
                 close=float(candle[4]),
                 volume=float(candle[5])
             )
-            ohlcvs.append(ohlcv)
+            for candle in candles
+        ]
+
+    async def get_historical_array(
+        self,
+        symbol: str,
+        timeframe: str = "60",
+        limit: int = 200
+    ) -> "np.ndarray":
+        """Get historical candles as one columnar float64 array
         
-        return ohlcvs
+        Cheaper than get_historical_data for indicator/backtest code that
+        works on whole columns rather than per-candle objects.
+        
+        Args:
+            symbol: Trading pair
+            timeframe: Interval in minutes (1, 5, 15, 30, 60, 240, 1440, etc.)
+            limit: Number of candles (max 1000)
+            
+        Returns:
+            Array of shape (N, 6): timestamp (ms), open, high, low, close, volume
+        """
+        data = await self._request(
+            "GET",
+            "market/kline",
+            {
+                "category": self._category,
+                "symbol": symbol,
+                "interval": timeframe,
+                "limit": min(limit, 1000)
+            }
+        )
+        
+        import numpy as np
+        
+        candles = self._rows(data)
+        if not candles:
+            return np.empty((0, 6), dtype=np.float64)
+        
+        # Bybit appends turnover as a 7th column; keep the OHLCV fields only
+        return np.asarray(candles, dtype=np.float64)[:, :6]
+
+    async def get_historical_frame(
+        self,
+        symbol: str,
+        timeframe: str = "60",
+        limit: int = 200
+    ) -> "pd.DataFrame":
+        """Get historical candles as a DataFrame built column-wise
+        
+        Columns are slices of the get_historical_array result, so pandas
+        does no per-cell type inference and no timestamp re-parsing.
+        
+        Args:
+            symbol: Trading pair
+            timeframe: Interval in minutes (1, 5, 15, 30, 60, 240, 1440, etc.)
+            limit: Number of candles (max 1000)
+            
+        Returns:
+            DataFrame with timestamp (datetime64[ms]), open, high, low, close, volume
+        """
+        import pandas as pd
+        
+        arr = await self.get_historical_array(symbol, timeframe, limit)
+        return pd.DataFrame({
+            "timestamp": arr[:, 0].astype("int64").view("datetime64[ms]"),
+            "open": arr[:, 1],
+            "high": arr[:, 2],
+            "low": arr[:, 3],
+            "close": arr[:, 4],
+            "volume": arr[:, 5]
+        })
+
     async def place_order(self, order: Order) -> Dict[str, Any]:
         """Place a new trading order
         
@@ -407,10 +716,8 @@ class BybitAPI(BaseExchange):
             >>> response = await client.place_order(order)
             >>> print(f"Order ID: {response['orderId']}")
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         order_data = {
-            "category": category,
+            "category": self._category,
             "symbol": order.symbol,
             "side": order.side.value.upper(),
             "orderType": "Limit" if order.price else "Market",
@@ -426,17 +733,20 @@ class BybitAPI(BaseExchange):
             data=order_data,
             signed=True
         )
-        
-        # Emit LLM callback
-        await self._emit_llm_callback("on_order", {
-            "exchange": "bybit",
-            "action": "place",
-            "symbol": order.symbol,
-            "side": order.side.value,
-            "quantity": order.quantity,
-            "price": order.price,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        # A fill changes the position; don't serve the pre-order row
+        self._position_cache.pop(order.symbol, None)
+        
+        # Emit LLM callback (order events are distinct, so build only when consumed)
+        if self.llm_callbacks.get("on_order"):
+            self._schedule_llm_callback("on_order", {
+                "exchange": "bybit",
+                "action": "place",
+                "symbol": order.symbol,
+                "side": order.side.value,
+                "quantity": order.quantity,
+                "price": order.price,
+                "timestamp": self._iso_now()
+            })
         
         return response
 
@@ -450,26 +760,26 @@ class BybitAPI(BaseExchange):
         Returns:
             Cancellation response
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         response = await self._request(
             "POST",
             "order/cancel",
             data={
-                "category": category,
+                "category": self._category,
                 "symbol": symbol,
                 "orderId": order_id
             },
             signed=True
         )
+        self._position_cache.pop(symbol, None)
         
-        await self._emit_llm_callback("on_order", {
-            "exchange": "bybit",
-            "action": "cancel",
-            "order_id": order_id,
-            "symbol": symbol,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        if self.llm_callbacks.get("on_order"):
+            self._schedule_llm_callback("on_order", {
+                "exchange": "bybit",
+                "action": "cancel",
+                "order_id": order_id,
+                "symbol": symbol,
+                "timestamp": self._iso_now()
+            })
         
         return response
 
@@ -483,13 +793,11 @@ class BybitAPI(BaseExchange):
         Returns:
             Order details with status, executed quantity
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         orders = await self._request(
             "GET",
             "order/history",
             {
-                "category": category,
+                "category": self._category,
                 "symbol": symbol,
                 "orderId": order_id,
                 "limit": 1
@@ -497,10 +805,8 @@ class BybitAPI(BaseExchange):
             signed=True
         )
         
-        if orders and "list" in orders and len(orders["list"]) > 0:
-            return orders["list"][0]
-        
-        return {}
+        rows = self._rows(orders)
+        return rows[0] if rows else {}
 
     async def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict]:
         """Get all open orders
@@ -511,10 +817,8 @@ class BybitAPI(BaseExchange):
         Returns:
             List of open orders
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         params = {
-            "category": category,
+            "category": self._category,
             "openOnly": 1,
             "limit": 50
         }
@@ -529,7 +833,7 @@ class BybitAPI(BaseExchange):
             signed=True
         )
         
-        return data.get("list", []) if isinstance(data, dict) else data
+        return self._rows(data)
 
     async def get_balance(self, asset: str) -> Dict[str, float]:
         """Get account balance for an asset
@@ -540,24 +844,21 @@ class BybitAPI(BaseExchange):
         Returns:
             Dict with 'free' and 'locked' balances
         """
-        account_type = "SPOT" if self.trading_type == BybitTradingType.SPOT else "CONTRACT"
-        
         data = await self._request(
             "GET",
             "account/wallet-balance",
-            {"accountType": account_type},
+            # Filter server-side so the payload carries one coin, not the whole wallet
+            {"accountType": self._account_type, "coin": asset},
             signed=True
         )
         
-        coins = data.get("list", [])
-        if coins and len(coins) > 0:
-            for coin_group in coins:
-                for coin in coin_group.get("coin", []):
-                    if coin.get("coin") == asset:
-                        return {
-                            "free": float(coin.get("walletBalance", 0)),
-                            "locked": float(coin.get("walletBalance", 0)) - float(coin.get("availableToWithdraw", 0))
-                        }
+        for coin_group in self._rows(data):
+            for coin in coin_group.get("coin", []):
+                if coin.get("coin") == asset:
+                    return {
+                        "free": float(coin.get("walletBalance", 0)),
+                        "locked": float(coin.get("walletBalance", 0)) - float(coin.get("availableToWithdraw", 0))
+                    }
         
         return {"free": 0.0, "locked": 0.0}
 
@@ -571,16 +872,10 @@ class BybitAPI(BaseExchange):
         Returns:
             Order book with bids and asks
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         return await self._request(
             "GET",
             "market/orderbook",
-            {
-                "category": category,
-                "symbol": symbol,
-                "limit": depth
-            }
+            self._poll_params("market/orderbook", symbol, depth)
         )
 
     async def get_leverage(self, symbol: str) -> int:
@@ -592,23 +887,11 @@ class BybitAPI(BaseExchange):
         Returns:
             Leverage multiplier
         """
-        if self.trading_type == BybitTradingType.SPOT:
+        if self._is_spot:
             return 1
         
-        positions = await self._request(
-            "GET",
-            "position/list",
-            {
-                "category": "linear" if self.trading_type == BybitTradingType.LINEAR_FUTURES else "inverse",
-                "symbol": symbol
-            },
-            signed=True
-        )
-        
-        if positions and "list" in positions and len(positions["list"]) > 0:
-            return int(positions["list"][0].get("leverage", 1))
-        
-        return 1
+        position = await self._position_row(symbol)
+        return int(position.get("leverage") or 1)
 
     async def set_leverage(self, symbol: str, leverage: int) -> Dict[str, Any]:
         """Set leverage for perpetuals trading
@@ -620,22 +903,22 @@ class BybitAPI(BaseExchange):
         Returns:
             Leverage setting response
         """
-        if self.trading_type == BybitTradingType.SPOT:
+        if self._is_spot:
             raise ValueError("Leverage only available for perpetuals")
         
-        category = "linear" if self.trading_type == BybitTradingType.LINEAR_FUTURES else "inverse"
-        
-        return await self._request(
+        response = await self._request(
             "POST",
             "position/set-leverage",
             data={
-                "category": category,
+                "category": self._category,
                 "symbol": symbol,
                 "buyLeverage": str(leverage),
                 "sellLeverage": str(leverage)
             },
             signed=True
         )
+        self._position_cache.pop(symbol, None)
+        return response
 
     async def get_funding_rate(self, symbol: str) -> Dict[str, Any]:
         """Get current funding rate for perpetuals
@@ -646,25 +929,21 @@ class BybitAPI(BaseExchange):
         Returns:
             Dict with fundingRate and funding info
         """
-        if self.trading_type == BybitTradingType.SPOT:
+        if self._is_spot:
             raise ValueError("Funding rate only available for perpetuals")
         
-        category = "linear" if self.trading_type == BybitTradingType.LINEAR_FUTURES else "inverse"
-        
         data = await self._request(
             "GET",
             "market/funding/history",
             {
-                "category": category,
+                "category": self._category,
                 "symbol": symbol,
                 "limit": 1
             }
         )
         
-        if data and "list" in data and len(data["list"]) > 0:
-            return data["list"][0]
-        
-        return {}
+        rows = self._rows(data)
+        return rows[0] if rows else {}
 
     async def get_position(self, symbol: str) -> Dict[str, Any]:
         """Get current position for perpetuals
@@ -675,25 +954,52 @@ class BybitAPI(BaseExchange):
         Returns:
             Position details with size, entry price, PnL
         """
-        if self.trading_type == BybitTradingType.SPOT:
+        if self._is_spot:
             raise ValueError("Positions only available for perpetuals")
         
-        category = "linear" if self.trading_type == BybitTradingType.LINEAR_FUTURES else "inverse"
+        return await self._position_row(symbol)
+
+    async def _position_row(self, symbol: str) -> Dict[str, Any]:
+        """Fetch a symbol's position row, reusing it for _POSITION_TTL seconds
+        
+        get_leverage, get_position and get_liquidation_price read the same
+        row, so a pre-trade check calling all three costs one request.
+        """
+        cached = self._position_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < _POSITION_TTL:
+            return cached[1]
         
         positions = await self._request(
             "GET",
             "position/list",
             {
-                "category": category,
+                "category": self._category,
                 "symbol": symbol
             },
             signed=True
         )
         
-        if positions and "list" in positions and len(positions["list"]) > 0:
-            return positions["list"][0]
+        rows = self._rows(positions)
+        position = rows[0] if rows else {}
+        self._position_cache[symbol] = (time.monotonic(), position)
+        return position
+
+    async def get_liquidation_price(self, symbol: str) -> float:
+        """Get the liquidation price of the current perpetuals position
+        
+        Args:
+            symbol: Trading pair
+            
+        Returns:
+            Liquidation price, or 0.0 when there is no open position
+        """
+        position = await self.get_position(symbol)
         
-        return {}
+        # v5 reports liqPrice on the position row itself ("" when flat)
+        try:
+            return float(position["liqPrice"])
+        except (KeyError, TypeError, ValueError):
+            return 0.0
 
     async def subscribe_ticker(
         self,
@@ -706,15 +1012,7 @@ class BybitAPI(BaseExchange):
             symbol: Trading pair
             callback: Async callable receiving ticker data
         """
-        stream_name = f"tickers.{symbol}"
-        
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
-        
-        self.subscriptions[stream_name].append(callback)
-        
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
+        await self._subscribe(f"tickers.{symbol}", callback)
 
     async def subscribe_trades(
         self,
@@ -727,15 +1025,7 @@ class BybitAPI(BaseExchange):
             symbol: Trading pair
             callback: Async callable receiving trade data
         """
-        stream_name = f"publicTrade.{symbol}"
-        
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
-        
-        self.subscriptions[stream_name].append(callback)
-        
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
+        await self._subscribe(f"publicTrade.{symbol}", callback)
 
     async def subscribe_order_book(
         self,
@@ -750,79 +1040,200 @@ class BybitAPI(BaseExchange):
             callback: Async callable receiving order book
             depth: Depth level (1, 5, 20, 50)
         """
-        stream_name = f"orderbook.{depth}.{symbol}"
+        await self._subscribe(f"orderbook.{depth}.{symbol}", callback)
+
+    def _cached_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Ticker fields for symbol from the WS stream or a fresh get_all_tickers pull"""
+        streamed = self._ticker_cache.get(symbol)
+        if streamed is not None:
+            return streamed
+        cached = self._all_tickers_cache
+        if cached is not None and time.monotonic() - cached[0] < _TICKERS_TTL:
+            return cached[1].get(symbol)
+        return None
+
+    async def get_all_tickers(self) -> Dict[str, Dict[str, Any]]:
+        """Get every symbol's ticker in one request (cached for _TICKERS_TTL seconds)
+        
+        While fresh, the result also answers get_price/get_mark_price/
+        get_index_price, so a loop over N symbols costs one round-trip.
+        
+        Returns:
+            Dict mapping symbol to its raw ticker (lastPrice, markPrice, indexPrice, ...)
+        """
+        cached = self._all_tickers_cache
+        if cached is not None and time.monotonic() - cached[0] < _TICKERS_TTL:
+            return cached[1]
+        
+        data = await self._request("GET", "market/tickers", {"category": self._category})
+        tickers = {t["symbol"]: t for t in self._rows(data)}
+        self._all_tickers_cache = (time.monotonic(), tickers)
+        return tickers
+
+    async def get_mark_prices(self, symbols: Optional[List[str]] = None) -> Dict[str, float]:
+        """Get mark prices for many perpetuals with a single tickers request
+        
+        Args:
+            symbols: Trading pairs to include (all symbols if None)
+            
+        Returns:
+            Dict mapping symbol to mark price; unknown symbols are omitted
+        """
+        if self._is_spot:
+            raise ValueError("Mark price only for perpetuals")
         
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
+        tickers = await self.get_all_tickers()
+        if symbols is None:
+            symbols = list(tickers)
+        return {s: float(tickers[s]["markPrice"]) for s in symbols if s in tickers}
+
+    async def start_ticker_stream(self, symbols: List[str]) -> None:
+        """Serve last/mark/index prices for symbols from the WS ticker stream
         
-        self.subscriptions[stream_name].append(callback)
+        Once a symbol's first snapshot arrives, get_price, get_mark_price and
+        get_index_price read it from memory instead of polling REST. Until
+        then, and while the socket is reconnecting, they fall back to REST.
         
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
+        Args:
+            symbols: Trading pairs to stream
+        """
+        for symbol in symbols:
+            await self._subscribe(f"tickers.{symbol}", self._cache_ticker)
 
-    async def _maintain_ws(self, stream_name: str) -> None:
-        """Maintain WebSocket connection with auto-reconnect
+    async def _cache_ticker(self, message: Dict) -> None:
+        """Merge a tickers.* snapshot or delta into _ticker_cache"""
+        data = message["data"]
+        # Derivatives deltas carry only changed fields, so merge rather than replace
+        self._ticker_cache.setdefault(data["symbol"], {}).update(data)
+
+    async def _subscribe(self, topic: str, callback: Callable) -> None:
+        """Register a callback and subscribe the topic on the shared public socket
         
         Args:
-            stream_name: Stream identifier
+            topic: Bybit topic (e.g. 'tickers.BTCUSDT')
+            callback: Async callable receiving topic messages
+        """
+        is_new_topic = topic not in self.subscriptions
+        self.subscriptions[topic] = self.subscriptions.get(topic, ()) + (callback,)
+        
+        async with self._ws_lock:
+            if self._public_ws_task is None:
+                # The connection subscribes every registered topic once it is up
+                self._public_ws_task = asyncio.create_task(self._maintain_public_ws())
+            elif is_new_topic and self._public_ws is not None:
+                self._pending_subs.append(topic)
+                if self._sub_flush_handle is None:
+                    self._sub_flush_handle = asyncio.get_running_loop().call_soon(self._flush_subs)
+
+    def _flush_subs(self) -> None:
+        """Send the topics queued during the last loop tick (see _subscribe)"""
+        self._sub_flush_handle = None
+        task = asyncio.create_task(self._send_pending_subs())
+        # An earlier flush may still be waiting on _ws_lock; keep every task
+        # referenced until done so none is garbage-collected or missed by close()
+        self._sub_tasks.add(task)
+        task.add_done_callback(self._sub_tasks.discard)
+
+    async def _send_pending_subs(self) -> None:
+        """Subscribe all pending topics on the live socket in a single frame"""
+        async with self._ws_lock:
+            topics, self._pending_subs = self._pending_subs, []
+            if not topics or self._public_ws is None:
+                # A reconnect resubscribes every registered topic anyway
+                return
+            try:
+                await self._send_subscribe(self._public_ws, topics)
+            except ConnectionResetError:
+                # Socket is going down; the reconnect resubscribes every topic
+                logger.warning(f"WebSocket closing, deferring subscribe: {', '.join(topics)}")
+
+    async def _send_subscribe(self, ws: aiohttp.ClientWebSocketResponse, topics: List[str]) -> None:
+        """Send subscribe frames, at most _WS_MAX_ARGS topics per frame"""
+        for i in range(0, len(topics), _WS_MAX_ARGS):
+            subscribe_msg = {
+                "op": "subscribe",
+                "args": topics[i:i + _WS_MAX_ARGS]
+            }
+            await ws.send_str(json_dumps_str(subscribe_msg))
+
+    async def _maintain_public_ws(self) -> None:
+        """Maintain the shared public WebSocket with auto-reconnect
+        
+        All public topics for this client's category share one connection;
+        incoming frames are routed to callbacks by their topic field.
         """
         reconnect_delay = 1
         max_reconnect_delay = 60
         
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
-        while stream_name in self.subscriptions:
+        while self.subscriptions:
             try:
-                ws_url = f"{self.ws_base}/public/{category}"
+                if self.session is None or self.session.closed:
+                    self.session = self._new_session()
                 
-                async with aiohttp.ClientSession() as session:
-                    async with session.ws_connect(ws_url) as ws:
-                        self.ws_connections[stream_name] = ws
-                        reconnect_delay = 1
-                        
-                        # Subscribe to stream
-                        subscribe_msg = {
-                            "op": "subscribe",
-                            "args": [stream_name]
-                        }
-                        await ws.send_json(subscribe_msg)
-                        
-                        logger.info(f"WebSocket connected: {stream_name}")
+                # No permessage-deflate: book/trade frames are small, and inflating
+                # every one in Python costs more than parsing it
+                async with self.session.ws_connect(
+                    self._ws_public_url,
+                    compress=0,
+                    heartbeat=20,
+                    autoping=True,
+                    max_msg_size=0,
+                    receive_timeout=30
+                ) as ws:
+                    async with self._ws_lock:
+                        # Queued topics are covered by the full resubscribe
+                        self._pending_subs.clear()
+                        await self._send_subscribe(ws, list(self.subscriptions))
+                        self._public_ws = ws
+                        self.ws_connections["public"] = ws
+                    reconnect_delay = 1
+                    
+                    logger.info(f"WebSocket connected: {self._ws_public_url} ({len(self.subscriptions)} topics)")
+                    
+                    async for msg in ws:
+                        msg_type = msg.type
+                        # Bybit v5 frames are JSON; accept them as binary too so a
+                        # bytes payload goes straight to the decoder undecoded
+                        if msg_type is aiohttp.WSMsgType.TEXT or msg_type is aiohttp.WSMsgType.BINARY:
+                            data = json_loads(msg.data)
+                            if "topic" in data:
+                                await self._process_ws_message(data)
                         
-                        async for msg in ws:
-                            if msg.type == aiohttp.WSMsgType.TEXT:
-                                data = json.loads(msg.data)
-                                await self._process_ws_message(stream_name, data)
-                            
-                            elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
-                                logger.warning(f"WebSocket closed: {stream_name}")
-                                break
+                        elif msg_type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
+                            logger.warning(f"WebSocket closed: {self._ws_public_url}")
+                            break
             
             except Exception as e:
-                logger.error(f"WebSocket error ({stream_name}): {e}")
-                
-                if stream_name in self.ws_connections:
-                    del self.ws_connections[stream_name]
-                
+                logger.error(f"WebSocket error ({self._ws_public_url}): {e}")
                 await asyncio.sleep(reconnect_delay)
                 reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+            
+            finally:
+                self._public_ws = None
+                self.ws_connections.pop("public", None)
+                # Streamed prices go stale while disconnected; fall back to REST
+                self._ticker_cache.clear()
+        
+        self._public_ws_task = None
 
-    async def _process_ws_message(self, stream_name: str, data: Dict) -> None:
+    async def _process_ws_message(self, data: Dict) -> None:
         """Process WebSocket message and call callbacks
         
         Args:
-            stream_name: Stream identifier
-            data: Message data
+            data: Message data; routed by its 'topic' field
         """
-        try:
-            if stream_name not in self.subscriptions:
-                return
-            
-            for callback in self.subscriptions[stream_name]:
-                await callback(data)
-        
-        except Exception as e:
-            logger.error(f"Error processing WS message: {e}")
+        callbacks = self.subscriptions.get(data["topic"])
+        if not callbacks:
+            return
+        
+        # Run subscribers concurrently so a slow one doesn't delay the rest
+        results = await asyncio.gather(
+            *(callback(data) for callback in callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error processing WS message ({data['topic']}): {result}")
     async def get_recent_trades(self, symbol: str, limit: int = 500) -> List[Dict]:
         """Get recent trades on the market
         
@@ -833,19 +1244,13 @@ class BybitAPI(BaseExchange):
         Returns:
             List of recent trades
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         data = await self._request(
             "GET",
             "market/recent-trade",
-            {
-                "category": category,
-                "symbol": symbol,
-                "limit": min(limit, 1000)
-            }
+            self._poll_params("market/recent-trade", symbol, min(limit, 1000))
         )
         
-        return data.get("list", []) if isinstance(data, dict) else data
+        return self._rows(data)
 
     async def get_account_trades(
         self,
@@ -863,10 +1268,8 @@ class BybitAPI(BaseExchange):
         Returns:
             List of user's trades with commission
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         params = {
-            "category": category,
+            "category": self._category,
             "symbol": symbol,
             "limit": min(limit, 1000)
         }
@@ -881,7 +1284,7 @@ class BybitAPI(BaseExchange):
             signed=True
         )
         
-        return data.get("list", []) if isinstance(data, dict) else data
+        return self._rows(data)
 
     async def get_trading_rules(self) -> Dict[str, Any]:
         """Get exchange trading rules and symbol info
@@ -889,19 +1292,18 @@ class BybitAPI(BaseExchange):
         Returns:
             Trading rules for all symbols
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         data = await self._request(
             "GET",
             "market/instruments-info",
-            {"category": category, "limit": 1000}
+            {"category": self._category, "limit": 1000}
         )
         
         rules_by_symbol = {}
-        symbols_list = data.get("list", []) if isinstance(data, dict) else data
+        symbols_list = self._rows(data)
         
         for symbol_info in symbols_list:
             symbol = symbol_info.get("symbol")
+            self._decimals[symbol] = _instrument_decimals(symbol_info)
             rules_by_symbol[symbol] = {
                 "baseAsset": symbol_info.get("baseCoin"),
                 "quoteAsset": symbol_info.get("quoteCoin"),
@@ -916,6 +1318,32 @@ class BybitAPI(BaseExchange):
         
         return rules_by_symbol
 
+    async def get_fee_rates(self, symbol: str) -> Tuple[float, float]:
+        """Get maker/taker fee rates (cached per symbol for _FEE_TTL seconds)
+        
+        Args:
+            symbol: Trading pair
+            
+        Returns:
+            (maker rate, taker rate)
+        """
+        now = time.monotonic()
+        cached = self._fee_cache.get(symbol)
+        if cached is not None and now < cached[0]:
+            return cached[1], cached[2]
+        
+        fee_data = await self._request(
+            "GET",
+            "account/fee-rate",
+            {"category": self._category, "symbol": symbol},
+            signed=True
+        )
+        rates = (self._rows(fee_data) or [{}])[0]
+        maker_rate = float(rates.get("makerFeeRate", 0.0001))
+        taker_rate = float(rates.get("takerFeeRate", 0.0001))
+        self._fee_cache[symbol] = (now + _FEE_TTL, maker_rate, taker_rate)
+        return maker_rate, taker_rate
+
     async def estimate_fee(
         self,
         symbol: str,
@@ -932,18 +1360,17 @@ class BybitAPI(BaseExchange):
         Returns:
             Dict with fee estimates
         """
-        # Get fee info from account
-        fee_data = await self._request(
-            "GET",
-            "account/fee-rate",
-            {"symbol": symbol},
-            signed=True
-        )
+        maker_rate, taker_rate = await self.get_fee_rates(symbol)
         
         total_cost = quantity * price
-        
-        maker_rate = float(fee_data.get("makerFeeRate", 0.0001))
-        taker_rate = float(fee_data.get("takerFeeRate", 0.0001))
+        if not total_cost:
+            return {
+                "maker_fee": 0.0,
+                "taker_fee": 0.0,
+                "estimated_cost": 0.0,
+                "maker_rate": maker_rate,
+                "taker_rate": taker_rate
+            }
         
         return {
             "maker_fee": total_cost * maker_rate,
@@ -963,19 +1390,30 @@ class BybitAPI(BaseExchange):
             True if symbol is valid
         """
         try:
-            await self.get_price(symbol)
-            return True
+            return symbol in await self._tradeable_symbols()
         except Exception:
             return False
 
     async def get_server_time(self) -> int:
         """Get server time in milliseconds
         
+        The server clock is fetched at most every _TIME_SYNC_TTL seconds (or
+        after a timestamp error); in between it is advanced on the local
+        monotonic clock without a request.
+        
         Returns:
             Server timestamp in milliseconds
         """
+        sync = self._time_sync
+        if sync is not None:
+            elapsed = time.monotonic() - sync[0]
+            if elapsed < _TIME_SYNC_TTL:
+                return sync[1] + int(elapsed * 1000)
+        
         data = await self._request("GET", "market/time")
-        return int(data.get("timeSecond", int(time.time()))) * 1000
+        server_ms = int(data.get("timeSecond", int(time.time()))) * 1000
+        self._time_sync = (time.monotonic(), server_ms)
+        return server_ms
 
     async def set_position_mode(self, mode: BybitPositionMode) -> Dict[str, Any]:
         """Set position mode for perpetuals (one-way or hedge)
@@ -986,18 +1424,18 @@ class BybitAPI(BaseExchange):
         Returns:
             Position mode setting response
         """
-        if self.trading_type == BybitTradingType.SPOT:
+        if self._is_spot:
             raise ValueError("Position mode only for perpetuals")
         
-        category = "linear" if self.trading_type == BybitTradingType.LINEAR_FUTURES else "inverse"
-        
         self.position_mode = mode
+        self.invalidate_symbols()
+        self.invalidate_fees()
         
         return await self._request(
             "POST",
             "position/switch-mode",
             data={
-                "category": category,
+                "category": self._category,
                 "mode": mode.value
             },
             signed=True
@@ -1009,42 +1447,53 @@ class BybitAPI(BaseExchange):
         Returns:
             List of positions
         """
-        if self.trading_type == BybitTradingType.SPOT:
+        if self._is_spot:
             raise ValueError("Positions only for perpetuals")
         
-        category = "linear" if self.trading_type == BybitTradingType.LINEAR_FUTURES else "inverse"
-        
         data = await self._request(
             "GET",
             "position/list",
-            {"category": category, "limit": 200},
+            {"category": self._category, "limit": 200},
             signed=True
         )
         
-        return data.get("list", []) if isinstance(data, dict) else data
+        return self._rows(data)
 
     async def get_available_symbols(self) -> List[str]:
-        """Get list of all available trading symbols
+        """Get list of all available trading symbols (cached for _SYMBOLS_TTL seconds)
         
         Returns:
             List of symbol strings
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
+        await self._tradeable_symbols()
+        return list(self._symbols_cache[1])
+
+    async def _tradeable_symbols(self) -> FrozenSet[str]:
+        """Return the set of symbols in Trading status, refreshing it once the TTL expires"""
+        if self._symbols_cache and time.monotonic() - self._symbols_cache[0] < _SYMBOLS_TTL:
+            return self._symbols_cache[2]
         
         data = await self._request(
             "GET",
             "market/instruments-info",
-            {"category": category, "limit": 1000}
+            {"category": self._category, "limit": 1000}
         )
         
-        symbols = []
-        symbols_list = data.get("list", []) if isinstance(data, dict) else data
+        symbols = [s["symbol"] for s in self._rows(data) if s.get("status") == "Trading"]
         
-        for symbol_info in symbols_list:
-            if symbol_info.get("status") == "Trading":
-                symbols.append(symbol_info.get("symbol"))
-        
-        return symbols
+        self._symbols_cache = (time.monotonic(), symbols, frozenset(symbols))
+        return self._symbols_cache[2]
+
+    def invalidate_symbols(self) -> None:
+        """Drop the cached symbol list so the next lookup refetches it"""
+        self._symbols_cache = None
+
+    def invalidate_fees(self, symbol: Optional[str] = None) -> None:
+        """Drop cached fee rates for one symbol, or for all when symbol is None"""
+        if symbol is None:
+            self._fee_cache.clear()
+        else:
+            self._fee_cache.pop(symbol, None)
 
     async def amend_order(
         self,
@@ -1064,18 +1513,18 @@ class BybitAPI(BaseExchange):
         Returns:
             Amendment response
         """
-        category = "spot" if self.trading_type == BybitTradingType.SPOT else "linear"
-        
         data = {
-            "category": category,
+            "category": self._category,
             "symbol": symbol,
             "orderId": order_id
         }
         
+        # Fixed-precision strings at the symbol's step
+        price_decimals, qty_decimals = await self._symbol_decimals(symbol)
         if qty:
-            data["qty"] = str(qty)
+            data["qty"] = format_quantity(qty, qty_decimals)
         if price:
-            data["price"] = str(price)
+            data["price"] = format_decimal(price, price_decimals)
         
         return await self._request(
             "POST",
@@ -1084,21 +1533,41 @@ class BybitAPI(BaseExchange):
             signed=True
         )
 
+    async def _symbol_decimals(self, symbol: str) -> Tuple[Optional[int], Optional[int]]:
+        """(price decimals, qty decimals) for symbol, fetched once and cached
+        
+        Unknown symbols are not cached and format with plain str().
+        """
+        decimals = self._decimals.get(symbol)
+        if decimals is None:
+            data = await self._request(
+                "GET",
+                "market/instruments-info",
+                {"category": self._category, "symbol": symbol}
+            )
+            for symbol_info in self._rows(data):
+                self._decimals[symbol_info.get("symbol")] = _instrument_decimals(symbol_info)
+            decimals = self._decimals.get(symbol, (None, None))
+        return decimals
+
     async def get_account_info(self) -> Dict[str, Any]:
         """Get detailed account information
         
         Returns:
             Account details including VIP level, fees
         """
-        account_type = "SPOT" if self.trading_type == BybitTradingType.SPOT else "CONTRACT"
-        
         data = await self._request(
             "GET",
             "account/info",
-            {"accountType": account_type},
+            {"accountType": self._account_type},
             signed=True
         )
         
+        # A VIP tier change moves fee rates; refetch once the tier differs
+        if data.get("vipLevel") != self._vip_level:
+            self._vip_level = data.get("vipLevel")
+            self.invalidate_fees()
+        
         return data
 
     async def get_mark_price(self, symbol: str) -> float:
@@ -1110,26 +1579,25 @@ class BybitAPI(BaseExchange):
         Returns:
             Mark price
         """
-        if self.trading_type == BybitTradingType.SPOT:
+        if self._is_spot:
             raise ValueError("Mark price only for perpetuals")
         
-        category = "linear" if self.trading_type == BybitTradingType.LINEAR_FUTURES else "inverse"
+        cached = self._cached_ticker(symbol)
+        if cached is not None and "markPrice" in cached:
+            return float(cached["markPrice"])
         
         data = await self._request(
             "GET",
             "market/mark-price-kline",
-            {
-                "category": category,
-                "symbol": symbol,
-                "interval": "1",
-                "limit": 1
-            }
+            {**self._last_kline_params, "symbol": symbol}
         )
         
-        if data and "list" in data and len(data["list"]) > 0:
-            return float(data["list"][0][4])
-        
-        return 0.0
+        # Close of the latest 1m candle
+        rows = self._rows(data)
+        try:
+            return float(rows[0][4])
+        except (IndexError, TypeError, ValueError):
+            return 0.0
 
     async def get_index_price(self, symbol: str) -> float:
         """Get index price for perpetuals
@@ -1140,23 +1608,53 @@ class BybitAPI(BaseExchange):
         Returns:
             Index price
         """
-        if self.trading_type == BybitTradingType.SPOT:
+        if self._is_spot:
             raise ValueError("Index price only for perpetuals")
         
+        cached = self._cached_ticker(symbol)
+        if cached is not None and "indexPrice" in cached:
+            return float(cached["indexPrice"])
+        
         data = await self._request(
             "GET",
             "market/index-price-kline",
-            {
-                "symbol": symbol,
-                "interval": "1",
-                "limit": 1
-            }
+            {**self._last_kline_params, "symbol": symbol}
         )
         
-        if data and "list" in data and len(data["list"]) > 0:
-            return float(data["list"][0][4])
+        # Close of the latest 1m candle
+        rows = self._rows(data)
+        try:
+            return float(rows[0][4])
+        except (IndexError, TypeError, ValueError):
+            return 0.0
+
+    async def snapshot(self, symbol: str) -> Dict[str, Any]:
+        """Fetch a symbol's price, book, fee rates and mark/index price concurrently
+        
+        The requests are independent, so they are issued together and the
+        snapshot costs one round-trip instead of one per field. The shared
+        rate limiter still paces them.
         
-        return 0.0
+        Args:
+            symbol: Trading pair
+            
+        Returns:
+            Dict with 'price', 'order_book' and 'fee_rates' (maker, taker),
+            plus 'mark_price' and 'index_price' for perpetuals. A field whose
+            request failed holds the exception instead of a value.
+        """
+        fields = ["price", "order_book", "fee_rates"]
+        requests = [
+            self.get_price(symbol),
+            self.get_order_book(symbol),
+            self.get_fee_rates(symbol)
+        ]
+        if not self._is_spot:
+            fields += ["mark_price", "index_price"]
+            requests += [self.get_mark_price(symbol), self.get_index_price(symbol)]
+        
+        results = await asyncio.gather(*requests, return_exceptions=True)
+        return dict(zip(fields, results))
 
     def __repr__(self) -> str:
         """String representation of BybitAPI client"""
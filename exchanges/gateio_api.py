@@ -12,23 +12,83 @@ Provides unified interface for Gate.io spot and futures trading with:
 import asyncio
 import hashlib
 import hmac
-import json
 import logging
 import os
 import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from urllib.parse import quote, urlencode
 
 import aiohttp
+from yarl import URL
+
+if TYPE_CHECKING:
+    # numpy is only needed by get_historical_batch; imported there on first use
+    import numpy as np
 
 from .base_exchange import (
     BaseExchange, Order, OrderType, Side, OrderStatus,
-    Ticker, OHLCV, RateLimiter
+    Ticker, OHLCV, OHLCVBatch, TokenBucket, LLMEventQueue,
+    json_dumps, json_dumps_str, json_loads
 )
 
 logger = logging.getLogger(__name__)
 
+# hmac only takes the OpenSSL EVP path (SHA-NI/ARMv8 SHA2 where the CPU has
+# them) when hashlib's SHA-512 comes from OpenSSL rather than the builtin module
+_HAS_OPENSSL_SHA = getattr(hashlib.sha512, "__module__", "") == "_hashlib"
+if not _HAS_OPENSSL_SHA:
+    logger.warning("hashlib is not OpenSSL-backed; Gate.io request signing will be slower")
+
+# Quasi-static endpoint caching: (fresh TTL, extra stale-while-revalidate window) in seconds
+_RULES_CACHE = (3600.0, 3600.0)
+_SYMBOLS_CACHE = (600.0, 600.0)
+_TIME_OFFSET_CACHE = (60.0, 0.0)
+
+# How long (seconds) subscribe_* calls are collected into one subscribe frame
+_SUB_DEBOUNCE = 0.005
+
+# /spot/batch_orders accepts at most this many orders per call
+_BATCH_ORDER_MAX = 10
+
+# Spot order bodies are built straight to bytes; pairs, sides and decimal
+# amounts never contain characters that need JSON escaping
+_ORDER_TMPL = b'{"currency_pair":"%s","side":"%s","type":"%s","amount":"%s"%s}'
+_PRICE_TMPL = b',"price":"%s"'
+
+# Orders in flight at once for place_orders_parallel
+_PARALLEL_ORDERS = 20
+
+# Transport failures worth retrying; HTTP 429/5xx are retried by status.
+# Only GETs are retried after a timeout, disconnect or 5xx: an order POST may
+# already have been applied. Other methods are retried only when the connect
+# itself failed.
+_RETRYABLE_ERRORS = (
+    aiohttp.ClientConnectorError,
+    aiohttp.ServerDisconnectedError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+# Largest (inflated) WS frame accepted before aiohttp fails the connection
+_WS_MAX_MSG_SIZE = 4 * 1024 * 1024
+
+# Pending LLM events beyond this are dropped rather than stalling requests
+_CALLBACK_QUEUE_SIZE = 10_000
+
+
+def _maybe_applied(exc: BaseException) -> bool:
+    """Whether a failed non-GET request may still have been applied by Gate.io
+    
+    Rejections (HTTP 4xx, including a final 429) and failed connects never
+    reached the matching engine; timeouts, disconnects and 5xx may have.
+    """
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500
+    return not isinstance(exc, (aiohttp.ClientConnectorError, ValueError))
+
 
 class GateioOrderType(Enum):
     """Gate.io-specific order types"""
@@ -70,8 +130,15 @@ class GateioAPI(BaseExchange):
         secret_key: str = None,
         testnet: bool = False,
         trading_type: GateioTradingType = GateioTradingType.SPOT,
+        connector_limit: int = 100,
+        limit_per_host: int = 20,
     ):
-        """Initialize Gate.io API client"""
+        """Initialize Gate.io API client
+        
+        Args:
+            connector_limit: Max pooled connections in total (0 = unlimited)
+            limit_per_host: Max pooled connections per host
+        """
         api_key = api_key or os.getenv("GATEIO_API_KEY")
         secret_key = secret_key or os.getenv("GATEIO_SECRET_KEY")
         
@@ -81,6 +148,8 @@ class GateioAPI(BaseExchange):
         self.testnet = testnet
         self.session: Optional[aiohttp.ClientSession] = None
         self.ws_connections: Dict[str, Any] = {}
+        self.connector_limit = connector_limit
+        self.limit_per_host = limit_per_host
         
         if testnet:
             self.rest_base = "https://api-testnet.gateio.ws/api/v4"
@@ -89,108 +158,246 @@ class GateioAPI(BaseExchange):
             self.rest_base = "https://api.gateio.ws/api/v4"
             self.ws_base = "wss://api.gateio.ws/ws/v4"
         
-        self.rate_limiter = RateLimiter(max_requests=100, window_seconds=60)
+        # 100 requests/minute, refilled continuously rather than per window
+        self.rate_limiter = TokenBucket(capacity=100, refill_per_sec=100 / 60)
         self.subscriptions: Dict[str, List[Callable]] = {}
+        
+        # One WebSocket per channel (ws_connections is keyed by channel)
+        self._channel_streams: Dict[str, List[str]] = {}
+        # (channel, pair, book level or None) -> stream names, see _route_ws_message
+        self._routes: Dict[Tuple[str, str, Optional[str]], List[str]] = {}
+        self._ws_tasks: Dict[str, asyncio.Task] = {}
+        self._pending_subs: Dict[str, List[str]] = {}
+        self._stream_payloads: Dict[str, List[str]] = {}
+        self._sub_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._sub_tasks: Set[asyncio.Task] = set()
+        
+        # key -> (fetched_at, value), see _cached
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        
+        # LLM events are queued and run by one background worker, off the request path
+        self._llm_events = LLMEventQueue(self.emit_llm_event, _CALLBACK_QUEUE_SIZE)
+        
+        # Keyed HMAC prototype; copying it skips the SHA-512 ipad/opad setup per request.
+        # None without a secret, so requests fail clearly (see _sign)
+        self._hmac_proto = (
+            hmac.new(self.secret_key.encode(), None, hashlib.sha512) if self.secret_key else None
+        )
+        
+        # Headers that never change; _request copies them and adds Timestamp/SIGN
+        self._base_headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "KEY": self.api_key
+        }
+
+    @classmethod
+    def install_uvloop(cls) -> bool:
+        """Switch asyncio to uvloop's event loop policy if uvloop is installed
+        
+        Must be called before the first event loop is created (i.e. before
+        asyncio.run); loops that already exist keep running on asyncio.
+        Returns True when uvloop was installed.
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return False
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self.session = self._new_session()
         return self
 
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create the shared REST/WS session with a keep-alive connection pool"""
+        connector = aiohttp.TCPConnector(
+            limit=self.connector_limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(connector=connector)
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
     async def close(self):
         try:
-            for conn in self.ws_connections.values():
-                await conn.close()
+            await self._llm_events.close()
+            # Dropping subscriptions stops _maintain_ws from reconnecting
+            self.subscriptions.clear()
+            self._channel_streams.clear()
+            self._routes.clear()
+            self._stream_payloads.clear()
+            self._pending_subs.clear()
+            if self._sub_flush_handle is not None:
+                self._sub_flush_handle.cancel()
+                self._sub_flush_handle = None
+            # Snapshot: _maintain_ws pops its entry while the socket closes
+            await asyncio.gather(
+                *(conn.close() for conn in list(self.ws_connections.values())),
+                return_exceptions=True
+            )
+            self.ws_connections.clear()
+            tasks = [*self._ws_tasks.values(), *self._sub_tasks]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._ws_tasks.clear()
+            self._sub_tasks.clear()
             if self.session and not self.session.closed:
                 await self.session.close()
             logger.info("Gate.io API client closed successfully")
         except Exception as e:
             logger.error(f"Error closing Gate.io client: {e}")
 
-    def _get_signature(self, timestamp: str, method: str, path: str, body: str = "") -> str:
-        """Generate HMAC SHA512 signature"""
-        message = f"{method}\n{path}\n{body}\n{timestamp}"
-        
-        signature = hmac.new(
-            self.secret_key.encode(),
-            message.encode(),
-            hashlib.sha512
-        ).hexdigest()
+    def _emit_llm_callback(self, event: str, payload: Dict[str, Any]) -> None:
+        """Queue an LLM event without waiting for callbacks to run"""
+        if not self.llm_callbacks.get(event):
+            return
+        self._llm_events.put(event, payload)
+
+    def _get_signature(self, timestamp: bytes, method: bytes, path: bytes, body: bytes = b"") -> str:
+        """Generate HMAC SHA512 signature over method, path, body and timestamp
         
-        return signature
+        Takes bytes so the serialized body is signed without a decode/encode
+        round trip.
+        """
+        return self._sign(b"\n".join((method, path, body, timestamp)))
+
+    def _sign(self, message: bytes) -> str:
+        """HMAC-SHA512 hex digest of message with the API secret"""
+        if self._hmac_proto is None:
+            raise ValueError("Gate.io secret key is required for signed requests")
+        mac = self._hmac_proto.copy()
+        mac.update(message)
+        return mac.hexdigest()
 
     async def _request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
-        data: Optional[Dict] = None
+        data: Optional[Union[Dict, List, bytes]] = None
     ) -> Dict[str, Any]:
-        """Make authenticated API request"""
+        """Make authenticated API request
+        
+        data may be pre-serialized JSON bytes, which are signed and sent as is.
+        """
         if params is None:
             params = {}
         
-        await self.rate_limiter.acquire()
+        # Lazily open the pooled session for callers not using `async with`
+        if self.session is None or self.session.closed:
+            self.session = self._new_session()
         
         url = f"{self.rest_base}{endpoint}"
         timestamp = str(int(time.time()))
         
-        # Build query string
-        query_string = ""
-        if params and method == "GET":
-            query_string = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        # Encode the query once; the same string is signed and sent
+        query_string = urlencode(sorted(params.items()), quote_via=quote)
         
         path = endpoint
         if query_string:
             path = f"{endpoint}?{query_string}"
+            # encoded=True stops yarl from re-quoting what was signed
+            url = URL(f"{url}?{query_string}", encoded=True)
         
-        body = json.dumps(data) if data else ""
-        signature = self._get_signature(timestamp, method, path, body)
+        if isinstance(data, bytes):
+            body_bytes = data
+        else:
+            body_bytes = json_dumps(data) if data else b""
+        signature = self._get_signature(
+            timestamp.encode(), method.encode(), path.encode(), body_bytes
+        )
         
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "KEY": self.api_key,
-            "Timestamp": timestamp,
-            "SIGN": signature
-        }
+        headers = self._base_headers.copy()
+        headers["Timestamp"] = timestamp
+        headers["SIGN"] = signature
         
         max_retries = 3
-        retry_count = 0
+        idempotent = method == "GET"
         
-        while retry_count < max_retries:
+        for attempt in range(max_retries):
+            is_last = attempt == max_retries - 1
+            await self.rate_limiter.acquire()
             try:
                 async with self.session.request(
                     method,
                     url,
-                    params=params if method == "GET" else None,
-                    json=data,
+                    data=body_bytes or None,
                     headers=headers,
                     timeout=aiohttp.ClientTimeout(total=10)
                 ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        await self._emit_llm_callback("on_market_data", {
+                    # Order creation answers 201, everything else 200
+                    if 200 <= response.status < 300:
+                        result = json_loads(await response.read())
+                        self._emit_llm_callback("on_market_data", {
                             "exchange": "gateio",
                             "endpoint": endpoint,
-                            "timestamp": datetime.utcnow().isoformat()
+                            "timestamp_ns": time.time_ns()
                         })
                         return result
-                    elif response.status == 429:
-                        await asyncio.sleep(2 ** retry_count)
-                        retry_count += 1
-                    else:
-                        raise Exception(f"API Error: {response.status}")
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= max_retries:
+                    
+                    # 4xx rejections never heal on retry, and a 5xx POST may have been applied
+                    retryable = response.status == 429 or (response.status >= 500 and idempotent)
+                    if is_last or not retryable:
+                        body = (await response.read()).decode(errors="replace")
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=response.status,
+                            message=f"API Error: {body[:200]}"
+                        )
+            except _RETRYABLE_ERRORS as e:
+                # Only a failed connect proves a non-GET request was never sent
+                if is_last or not (idempotent or isinstance(e, aiohttp.ClientConnectorError)):
                     raise
-                await asyncio.sleep(2 ** retry_count)
+            
+            await asyncio.sleep(2 ** (attempt + 1))
         
         raise Exception("Max retries exceeded")
 
+    async def _cached(
+        self,
+        key: str,
+        policy: Tuple[float, float],
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Serve a quasi-static endpoint from cache with stale-while-revalidate
+        
+        Within the TTL the cached value is returned as is. In the following
+        stale window it is still returned immediately while one background
+        task refreshes it; past that the caller waits for a fresh fetch.
+        """
+        ttl, swr = policy
+        entry = self._cache.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < ttl:
+                return entry[1]
+            if age < ttl + swr:
+                if key not in self._refresh_tasks:
+                    self._refresh_tasks[key] = asyncio.create_task(self._refresh(key, fetch))
+                return entry[1]
+        
+        value = await fetch()
+        self._cache[key] = (time.monotonic(), value)
+        return value
+
+    async def _refresh(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        """Background refresh for _cached; a failure keeps the stale value"""
+        try:
+            self._cache[key] = (time.monotonic(), await fetch())
+        except Exception as e:
+            logger.warning(f"Background refresh of {key} failed: {e}")
+        finally:
+            self._refresh_tasks.pop(key, None)
+
     async def get_price(self, symbol: str) -> float:
         """Get current market price"""
         data = await self._request("GET", f"/spot/tickers", {"currency_pair": symbol})
@@ -216,7 +423,7 @@ class GateioAPI(BaseExchange):
             timestamp=datetime.utcnow()
         )
         
-        await self._emit_llm_callback("on_ticker_update", {
+        self._emit_llm_callback("on_ticker_update", {
             "symbol": symbol,
             "last_price": ticker.last_price,
             "volume_24h": ticker.volume_24h
@@ -231,6 +438,22 @@ class GateioAPI(BaseExchange):
         limit: int = 100
     ) -> List[OHLCV]:
         """Get historical OHLCV data"""
+        batch = await self.get_historical_batch(symbol, timeframe, limit)
+        return batch.as_ohlcv_list()
+
+    async def get_historical_batch(
+        self,
+        symbol: str,
+        timeframe: str = "1h",
+        limit: int = 100
+    ) -> OHLCVBatch:
+        """Get historical candles as numpy columns
+        
+        The string fields are parsed to float64 by numpy in one pass rather
+        than by float() per cell.
+        """
+        import numpy as np
+        
         data = await self._request(
             "GET",
             f"/spot/candlesticks",
@@ -241,52 +464,71 @@ class GateioAPI(BaseExchange):
             }
         )
         
-        ohlcvs = []
         candles = data if isinstance(data, list) else []
-        
-        for candle in candles:
-            ohlcv = OHLCV(
-                timestamp=datetime.fromtimestamp(int(candle[0])),
-                open=float(candle[1]),
-                high=float(candle[2]),
-                low=float(candle[3]),
-                close=float(candle[4]),
-                volume=float(candle[5])
+        if not candles:
+            empty = np.empty(0, dtype=np.float64)
+            return OHLCVBatch(np.empty(0, dtype="datetime64[s]"), empty, empty, empty, empty, empty)
+        
+        # Row: [time, quote volume, close, high, low, open, base volume, closed]
+        arr = np.asarray([candle[:7] for candle in candles]).astype(np.float64)
+        return OHLCVBatch(
+            timestamp=arr[:, 0].astype(np.int64).astype("datetime64[s]"),
+            open=arr[:, 5],
+            high=arr[:, 3],
+            low=arr[:, 4],
+            close=arr[:, 2],
+            volume=arr[:, 6]
+        )
+
+    @staticmethod
+    def _order_body(order: Order) -> bytes:
+        """Serialize a spot order to its JSON body without an intermediate dict"""
+        if order.price:
+            return _ORDER_TMPL % (
+                order.symbol.encode(), order.side.value.lower().encode(), b"limit",
+                str(order.quantity).encode(), _PRICE_TMPL % str(order.price).encode()
             )
-            ohlcvs.append(ohlcv)
-        
-        return ohlcvs
+        return _ORDER_TMPL % (
+            order.symbol.encode(), order.side.value.lower().encode(), b"market",
+            str(order.quantity).encode(), b""
+        )
 
     async def place_order(self, order: Order) -> Dict[str, Any]:
         """Place a new trading order"""
-        order_data = {
-            "currency_pair": order.symbol,
-            "side": order.side.value.lower(),
-            "type": "limit" if order.price else "market",
-            "amount": str(order.quantity),
-        }
-        
-        if order.price:
-            order_data["price"] = str(order.price)
-        
         response = await self._request(
             "POST",
             "/spot/orders",
-            data=order_data
+            data=self._order_body(order)
         )
         
-        await self._emit_llm_callback("on_order", {
+        self._emit_llm_callback("on_order", {
             "exchange": "gateio",
             "action": "place",
             "symbol": order.symbol,
             "side": order.side.value,
             "quantity": order.quantity,
             "price": order.price,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp_ns": time.time_ns()
         })
         
         return response
 
+    async def place_orders_parallel(self, orders: List[Order]) -> List[Union[Dict[str, Any], BaseException]]:
+        """Place orders concurrently, at most _PARALLEL_ORDERS in flight
+        
+        Results are returned in the order of orders. A failed order yields its
+        exception in place of a result, so the orders that did go through are
+        never lost to one failure. A timeout, disconnect or HTTP 5xx means
+        the order may still have been placed; it is not retried.
+        """
+        slots = asyncio.Semaphore(_PARALLEL_ORDERS)
+        
+        async def _one(order: Order) -> Dict[str, Any]:
+            async with slots:
+                return await self.place_order(order)
+        
+        return await asyncio.gather(*(_one(order) for order in orders), return_exceptions=True)
+
     async def cancel_order(self, order_id: str, symbol: str) -> Dict[str, Any]:
         """Cancel an existing order"""
         response = await self._request(
@@ -295,12 +537,12 @@ class GateioAPI(BaseExchange):
             {"currency_pair": symbol}
         )
         
-        await self._emit_llm_callback("on_order", {
+        self._emit_llm_callback("on_order", {
             "exchange": "gateio",
             "action": "cancel",
             "order_id": order_id,
             "symbol": symbol,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp_ns": time.time_ns()
         })
         
         return response
@@ -372,15 +614,7 @@ class GateioAPI(BaseExchange):
         callback: Callable
     ) -> None:
         """Subscribe to real-time ticker updates"""
-        stream_name = f"spot.tickers.{symbol}"
-        
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
-        
-        self.subscriptions[stream_name].append(callback)
-        
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
+        self._subscribe("spot.tickers", f"spot.tickers.{symbol}", symbol, [symbol], callback)
 
     async def subscribe_trades(
         self,
@@ -388,15 +622,7 @@ class GateioAPI(BaseExchange):
         callback: Callable
     ) -> None:
         """Subscribe to real-time trades"""
-        stream_name = f"spot.trades.{symbol}"
-        
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
-        
-        self.subscriptions[stream_name].append(callback)
-        
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
+        self._subscribe("spot.trades", f"spot.trades.{symbol}", symbol, [symbol], callback)
 
     async def subscribe_order_book(
         self,
@@ -405,57 +631,142 @@ class GateioAPI(BaseExchange):
         depth: int = 20
     ) -> None:
         """Subscribe to order book updates"""
-        stream_name = f"spot.order_book.{depth}.{symbol}"
+        self._subscribe(
+            "spot.order_book", f"spot.order_book.{depth}.{symbol}",
+            symbol, [symbol, str(depth), "100ms"], callback, level=str(depth)
+        )
+
+    def _subscribe(
+        self,
+        channel: str,
+        stream_name: str,
+        symbol: str,
+        payload: List[str],
+        callback: Callable,
+        level: Optional[str] = None
+    ) -> None:
+        """Register a callback and queue the stream for the channel's socket
+        
+        Each channel shares one WebSocket. New streams are collected for
+        _SUB_DEBOUNCE seconds so a burst of subscribe_* calls goes out as one
+        multi-symbol frame instead of one socket (or frame) per symbol.
+        payload is the stream's subscribe payload, kept for every resubscribe;
+        level is the order-book depth, so books of one pair are routed apart.
+        """
+        if stream_name in self.subscriptions:
+            self.subscriptions[stream_name].append(callback)
+            return
+        
+        self.subscriptions[stream_name] = [callback]
+        self._stream_payloads[stream_name] = payload
+        self._channel_streams.setdefault(channel, []).append(stream_name)
+        self._routes.setdefault((channel, symbol, level), []).append(stream_name)
+        self._pending_subs.setdefault(channel, []).append(stream_name)
+        
+        if self._sub_flush_handle is None:
+            self._sub_flush_handle = asyncio.get_running_loop().call_later(
+                _SUB_DEBOUNCE, self._flush_subs
+            )
+
+    def _flush_subs(self) -> None:
+        """Start a socket for new channels; subscribe queued streams on live ones"""
+        self._sub_flush_handle = None
+        pending, self._pending_subs = self._pending_subs, {}
         
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
+        for channel, stream_names in pending.items():
+            if channel not in self._ws_tasks:
+                # The new connection subscribes every stream of its channel
+                self._ws_tasks[channel] = asyncio.create_task(self._maintain_ws(channel))
+                continue
+            
+            ws = self.ws_connections.get(channel)
+            if ws is not None:
+                task = asyncio.create_task(self._send_subscribe(ws, channel, stream_names))
+                self._sub_tasks.add(task)
+                task.add_done_callback(self._sub_tasks.discard)
+
+    async def _send_subscribe(self, ws: aiohttp.ClientWebSocketResponse, channel: str, stream_names: List[str]) -> None:
+        """Subscribe streams of one channel, batching symbols into one frame where allowed"""
+        payloads = [self._stream_payloads[stream_name] for stream_name in stream_names]
         
-        self.subscriptions[stream_name].append(callback)
+        if all(len(payload) == 1 for payload in payloads):
+            # Ticker/trade channels take any number of pairs in one payload
+            payloads = [[payload[0] for payload in payloads]]
         
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
+        try:
+            for payload in payloads:
+                subscribe_msg = {
+                    "time": int(time.time()),
+                    "channel": channel,
+                    "event": "subscribe",
+                    "payload": payload
+                }
+                await ws.send_str(json_dumps_str(subscribe_msg))
+        except ConnectionResetError:
+            # Socket is going down; the reconnect resubscribes the whole channel
+            logger.warning(f"WebSocket closing, deferring subscribe on {channel}")
 
-    async def _maintain_ws(self, stream_name: str) -> None:
-        """Maintain WebSocket connection"""
+    async def _maintain_ws(self, channel: str) -> None:
+        """Maintain the shared WebSocket for one channel"""
         reconnect_delay = 1
         max_reconnect_delay = 60
         
-        while stream_name in self.subscriptions:
+        while self._channel_streams.get(channel) and self.subscriptions:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.ws_connect(self.ws_base) as ws:
-                        self.ws_connections[stream_name] = ws
-                        reconnect_delay = 1
-                        
-                        # Subscribe
-                        channel = stream_name.split(".")[1]
-                        symbol = stream_name.split(".")[-1]
-                        
-                        subscribe_msg = {
-                            "time": int(time.time()),
-                            "channel": channel,
-                            "event": "subscribe",
-                            "payload": [symbol]
-                        }
-                        await ws.send_json(subscribe_msg)
-                        
-                        logger.info(f"WebSocket connected: {stream_name}")
-                        
-                        async for msg in ws:
-                            if msg.type == aiohttp.WSMsgType.TEXT:
-                                data = json.loads(msg.data)
-                                await self._process_ws_message(stream_name, data)
-                            elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
-                                break
+                if self.session is None or self.session.closed:
+                    self.session = self._new_session()
+                
+                # Reuse the pooled session: no new connector/DNS cache per reconnect
+                # Order-book JSON repeats its keys and compresses well; aiohttp
+                # falls back to plain frames if the server declines deflate
+                async with self.session.ws_connect(
+                    self.ws_base,
+                    compress=15,
+                    max_msg_size=_WS_MAX_MSG_SIZE,
+                    heartbeat=20,
+                    autoping=True
+                ) as ws:
+                    self.ws_connections[channel] = ws
+                    reconnect_delay = 1
+                    
+                    await self._send_subscribe(ws, channel, self._channel_streams[channel])
+                    
+                    logger.info(f"WebSocket connected: {channel} ({len(self._channel_streams[channel])} streams)")
+                    
+                    async for msg in ws:
+                        # Gate.io v4 has no binary encoding; a BINARY frame is still
+                        # JSON, and the bytes go to the decoder as they are
+                        if msg.type == aiohttp.WSMsgType.TEXT or msg.type == aiohttp.WSMsgType.BINARY:
+                            data = json_loads(msg.data)
+                            if data.get("event") == "update":
+                                await self._route_ws_message(channel, data)
+                        elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
+                            break
             
             except Exception as e:
-                logger.error(f"WebSocket error ({stream_name}): {e}")
-                
-                if stream_name in self.ws_connections:
-                    del self.ws_connections[stream_name]
-                
+                logger.error(f"WebSocket error ({channel}): {e}")
                 await asyncio.sleep(reconnect_delay)
                 reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+            
+            finally:
+                self.ws_connections.pop(channel, None)
+        
+        self._ws_tasks.pop(channel, None)
+
+    async def _route_ws_message(self, channel: str, data: Dict) -> None:
+        """Deliver a channel update to the streams of its currency pair"""
+        result = data.get("result")
+        if not isinstance(result, dict):
+            return
+        
+        # Ticker/trade updates name the pair as currency_pair, book updates as s
+        # and carry their depth as l, which keeps books of one pair apart
+        symbol = result.get("currency_pair") or result.get("s")
+        level = result.get("l")
+        if level is not None:
+            level = str(level)
+        for stream_name in self._routes.get((channel, symbol, level), ()):
+            await self._process_ws_message(stream_name, data)
 
     async def _process_ws_message(self, stream_name: str, data: Dict) -> None:
         """Process WebSocket message"""
@@ -493,25 +804,27 @@ class GateioAPI(BaseExchange):
         return await self._request("GET", "/spot/my_trades", params)
 
     async def get_trading_rules(self) -> Dict[str, Any]:
-        """Get trading rules"""
+        """Get trading rules (cached, see _RULES_CACHE)"""
+        return await self._cached("trading_rules", _RULES_CACHE, self._fetch_trading_rules)
+
+    async def _fetch_trading_rules(self) -> Dict[str, Any]:
+        """Fetch trading rules for all currency pairs"""
         data = await self._request("GET", "/spot/currency_pairs")
         
-        rules_by_symbol = {}
         symbols_list = data if isinstance(data, list) else []
         
-        for symbol_info in symbols_list:
-            symbol = symbol_info.get("id")
-            rules_by_symbol[symbol] = {
-                "baseAsset": symbol_info.get("base"),
-                "quoteAsset": symbol_info.get("quote"),
-                "status": symbol_info.get("trade_status"),
+        return {
+            row.get("id"): {
+                "baseAsset": row.get("base"),
+                "quoteAsset": row.get("quote"),
+                "status": row.get("trade_status"),
                 "filters": {
-                    "minPrice": symbol_info.get("min_base_amount"),
-                    "maxQty": symbol_info.get("max_base_amount")
+                    "minPrice": row.get("min_base_amount"),
+                    "maxQty": row.get("max_base_amount")
                 }
             }
-        
-        return rules_by_symbol
+            for row in symbols_list
+        }
 
     async def estimate_fee(
         self,
@@ -543,30 +856,39 @@ class GateioAPI(BaseExchange):
             return False
 
     async def get_server_time(self) -> int:
-        """Get server time"""
+        """Get server time
+        
+        The server-local clock offset is cached (see _TIME_OFFSET_CACHE), so
+        most calls are local arithmetic that still advances with real time.
+        """
+        offset = await self._cached("server_time_offset", _TIME_OFFSET_CACHE, self._fetch_time_offset)
+        return int(time.time() * 1000) + offset
+
+    async def _fetch_time_offset(self) -> int:
+        """Fetch server time and return its offset from the local clock in ms"""
         data = await self._request("GET", "/spot/time")
         
-        if isinstance(data, dict):
-            return int(data.get("mstime", int(time.time() * 1000)))
+        if isinstance(data, dict) and "mstime" in data:
+            return int(data["mstime"]) - int(time.time() * 1000)
         
-        return int(time.time() * 1000)
+        return 0
 
     async def get_positions(self) -> List[Dict]:
         """Get all positions"""
         return await self._request("GET", "/perpetual/positions", {"settle": "usdt"})
 
     async def get_available_symbols(self) -> List[str]:
-        """Get available symbols"""
+        """Get available symbols (cached, see _SYMBOLS_CACHE)"""
+        symbols = await self._cached("available_symbols", _SYMBOLS_CACHE, self._fetch_available_symbols)
+        return list(symbols)
+
+    async def _fetch_available_symbols(self) -> List[str]:
+        """Fetch the tradable currency pairs"""
         data = await self._request("GET", "/spot/currency_pairs")
         
-        symbols = []
         symbols_list = data if isinstance(data, list) else []
         
-        for symbol_info in symbols_list:
-            if symbol_info.get("trade_status") == "tradable":
-                symbols.append(symbol_info.get("id"))
-        
-        return symbols
+        return [row.get("id") for row in symbols_list if row.get("trade_status") == "tradable"]
 
     async def amend_order(
         self,
@@ -771,22 +1093,40 @@ class GateioAPI(BaseExchange):
         )
 
     async def batch_orders(self, orders: List[Order]) -> List[Dict]:
-        """Place multiple orders"""
-        order_list = []
-        for order in orders:
-            order_list.append({
-                "currency_pair": order.symbol,
-                "side": order.side.value.lower(),
-                "type": "limit" if order.price else "market",
-                "amount": str(order.quantity),
-                "price": str(order.price) if order.price else None
-            })
-        
-        return await self._request(
-            "POST",
-            "/spot/batch_orders",
-            data=order_list
-        )
+        """Place multiple orders
+        
+        Orders are sent in chunks of _BATCH_ORDER_MAX (the per-call limit),
+        all chunks concurrently; results keep the order of orders. Every order
+        of a chunk whose request failed gets a Gate.io-style entry instead, so
+        results from the other chunks are still returned:
+        
+        - {"succeeded": False, "label": "REQUEST_FAILED", ...} when Gate.io
+          rejected the batch or it was never sent
+        - {"succeeded": None, "label": "OUTCOME_UNKNOWN", ...} after a timeout,
+          disconnect or 5xx, when the orders may have been placed; check
+          get_open_orders before resubmitting them
+        """
+        bodies = [self._order_body(order) for order in orders]
+        chunks = [bodies[i:i + _BATCH_ORDER_MAX] for i in range(0, len(bodies), _BATCH_ORDER_MAX)]
+        
+        responses = await asyncio.gather(*(
+            self._request("POST", "/spot/batch_orders", data=b"[" + b",".join(chunk) + b"]")
+            for chunk in chunks
+        ), return_exceptions=True)
+        
+        results = []
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, BaseException):
+                if _maybe_applied(response):
+                    logger.error(f"Gate.io batch of {len(chunk)} orders has an unknown outcome: {response!r}")
+                    entry = {"succeeded": None, "label": "OUTCOME_UNKNOWN", "message": repr(response)}
+                else:
+                    logger.error(f"Gate.io batch of {len(chunk)} orders failed: {response!r}")
+                    entry = {"succeeded": False, "label": "REQUEST_FAILED", "message": repr(response)}
+                results.extend(dict(entry) for _ in chunk)
+            else:
+                results.extend(response)
+        return results
 
     async def get_max_withdrawal(self, currency: str) -> Dict[str, float]:
         """Get maximum withdrawal amount"""
@@ -12,24 +12,82 @@ Provides unified interface for Huobi (now HTX) spot and futures trading with:
 import asyncio
 import hashlib
 import hmac
-import json
+import itertools
 import logging
 import os
+import random
 import time
+import zlib
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 import urllib.parse
 
 import aiohttp
+from yarl import URL
+
+if TYPE_CHECKING:
+    # numpy is only needed by get_historical_batch; imported there on first use
+    import numpy as np
 
 from .base_exchange import (
     BaseExchange, Order, OrderType, Side, OrderStatus,
-    Ticker, OHLCV, RateLimiter
+    Ticker, OHLCV, OHLCVBatch, TokenBucket, LLMEventQueue,
+    json_dumps_str, json_loads, retry_after
 )
 
 logger = logging.getLogger(__name__)
 
+# Every REST call shares this overall timeout, set once on the session
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Updates buffered per WS callback; past this the oldest is dropped
+_CALLBACK_QUEUE_SIZE = 1024
+
+# Pending LLM events; past this the oldest is dropped rather than stalling requests
+_LLM_QUEUE_SIZE = 4096
+
+# zlib window bits selecting a gzip wrapper; Huobi gzips every WS frame
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+# Transport failures worth retrying; HTTP 429/5xx are retried by status.
+# Only GETs are retried after a timeout, disconnect or 5xx: a POST may already
+# have been applied. A POST is retried only when the connect itself failed.
+_RETRYABLE_ERRORS = (
+    aiohttp.ClientConnectorError,
+    aiohttp.ServerDisconnectedError,
+    asyncio.TimeoutError,
+)
+
+# Backoff steps (seconds) for retries and WS reconnects; each wait is jittered
+# by 0.5-1.5x so clients that failed together don't retry in lockstep
+_BACKOFFS = (0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 60.0)
+
+# Kline dict -> (id, open, high, low, close, vol) in one C call
+_KLINE_FIELDS = itemgetter("id", "open", "high", "low", "close", "vol")
+
+# Symbol listings change rarely; refetch them at most this often (seconds)
+_SYMBOLS_TTL = 60.0
+
+
+def _backoff(attempt: int) -> float:
+    """Jittered wait before retry number attempt (0-based)"""
+    return _BACKOFFS[min(attempt, len(_BACKOFFS) - 1)] * random.uniform(0.5, 1.5)
+
+
+# (epoch second, its UTC ISO-8601 text) for _ts_iso
+_last_ts_iso: Tuple[int, str] = (-1, "")
+
+
+def _ts_iso() -> str:
+    """Current UTC time as YYYY-MM-DDTHH:MM:SS, formatted at most once per second"""
+    global _last_ts_iso
+    now = int(time.time())
+    if _last_ts_iso[0] != now:
+        _last_ts_iso = (now, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)))
+    return _last_ts_iso[1]
+
 
 class HuobiOrderType(Enum):
     """Huobi-specific order types"""
@@ -73,8 +131,15 @@ class HuobiAPI(BaseExchange):
         secret_key: str = None,
         testnet: bool = False,
         trading_type: HuobiTradingType = HuobiTradingType.SPOT,
+        connector_limit: int = 64,
+        limit_per_host: int = 20,
     ):
-        """Initialize Huobi API client"""
+        """Initialize Huobi API client
+        
+        Args:
+            connector_limit: Max pooled connections in total (0 = unlimited)
+            limit_per_host: Max pooled connections per host
+        """
         api_key = api_key or os.getenv("HUOBI_API_KEY")
         secret_key = secret_key or os.getenv("HUOBI_SECRET_KEY")
         
@@ -84,6 +149,8 @@ class HuobiAPI(BaseExchange):
         self.testnet = testnet
         self.session: Optional[aiohttp.ClientSession] = None
         self.ws_connections: Dict[str, Any] = {}
+        self.connector_limit = connector_limit
+        self.limit_per_host = limit_per_host
         
         if testnet:
             self.rest_base = "https://api.testnet.huobi.pro"
@@ -92,37 +159,117 @@ class HuobiAPI(BaseExchange):
             self.rest_base = "https://api.huobi.pro"
             self.ws_base = "wss://api.huobi.pro"
         
-        self.rate_limiter = RateLimiter(max_requests=10, window_seconds=1)
+        # 10 requests/second as a token bucket, with at most limit_per_host in flight
+        self.rate_limiter = TokenBucket(capacity=10, refill_per_sec=10)
+        self._request_slots = asyncio.BoundedSemaphore(limit_per_host)
         self.subscriptions: Dict[str, List[Callable]] = {}
+        
+        # Every stream shares one WebSocket; frames are routed by their "ch" topic.
+        # Several streams can share a topic (order books of different depths).
+        self._topic_streams: Dict[str, List[str]] = {}
+        self._ws_task: Optional[asyncio.Task] = None
+        self._sub_tasks: Set[asyncio.Task] = set()
+        self._sub_ids = itertools.count(1)
+        # Each callback drains its own bounded queue, so a slow one never blocks the reader
+        self._callback_queues: Dict[str, List[asyncio.Queue]] = {}
+        self._callback_workers: List[asyncio.Task] = []
+        
+        # (fetched_at, online symbols, same as a set), see _online_symbols
+        self._symbols_cache: Optional[Tuple[float, List[str], FrozenSet[str]]] = None
+        
+        # LLM events are queued and run by one background worker, off the request path
+        self._llm_events = LLMEventQueue(self.emit_llm_event, _LLM_QUEUE_SIZE)
+        
+        # Spot account id, looked up once (see _get_account_id)
+        self._account_id: Optional[str] = None
+        self._account_id_lock = asyncio.Lock()
+        
+        # Keyed HMAC prototype; copying it skips the SHA-256 ipad/opad setup per request.
+        # None without a secret, so private calls fail clearly (see _get_signature)
+        self._hmac_proto = None
+        if self.secret_key:
+            # Huobi secrets are ASCII; encode once here and fail fast on anything else
+            try:
+                secret_bytes = self.secret_key.encode("ascii")
+            except UnicodeEncodeError:
+                raise ValueError("Huobi secret key must be ASCII")
+            self._hmac_proto = hmac.new(secret_bytes, None, hashlib.sha256)
+        # Host line of the signed payload, split out of rest_base once
+        self._host_bytes = self.rest_base.split("//", 1)[1].encode()
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        self._get_session()
         return self
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared REST/WS session, opening it on first use
+        
+        One keep-alive pool serves every REST call and WebSocket reconnect,
+        so neither pays a fresh DNS lookup and TLS handshake.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connector_limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            # json_serialize routes aiohttp's own JSON encoding (send_json, json=) to orjson too
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=_REQUEST_TIMEOUT,
+                json_serialize=json_dumps_str
+            )
+        return self.session
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
     async def close(self):
         try:
-            for conn in self.ws_connections.values():
-                await conn.close()
+            await self._llm_events.close()
+            # Dropping subscriptions stops _maintain_ws from reconnecting
+            self.subscriptions.clear()
+            self._topic_streams.clear()
+            self._callback_queues.clear()
+            for worker in self._callback_workers:
+                worker.cancel()
+            await asyncio.gather(*self._callback_workers, return_exceptions=True)
+            self._callback_workers.clear()
+            # Snapshot: _maintain_ws pops its entry while the socket closes
+            await asyncio.gather(
+                *(conn.close() for conn in list(self.ws_connections.values())),
+                return_exceptions=True
+            )
+            self.ws_connections.clear()
+            tasks = [task for task in (self._ws_task, *self._sub_tasks) if task is not None]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._ws_task = None
+            self._sub_tasks.clear()
             if self.session and not self.session.closed:
                 await self.session.close()
             logger.info("Huobi API client closed successfully")
         except Exception as e:
             logger.error(f"Error closing Huobi client: {e}")
 
+    def _emit_llm_callback(self, event: str, payload: Dict[str, Any]) -> None:
+        """Queue an LLM event without waiting for callbacks to run"""
+        if not self.llm_callbacks.get(event):
+            return
+        self._llm_events.put(event, payload)
+
     def _get_signature(self, method: str, path: str, query_string: str) -> str:
-        """Generate HMAC SHA256 signature"""
-        message = f"{method}\n{self.rest_base.split('//')[1]}\n{path}\n{query_string}"
-        
-        signature = hmac.new(
-            self.secret_key.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        
-        return signature
+        """Generate HMAC SHA256 signature over method, host, path and query"""
+        if self._hmac_proto is None:
+            raise ValueError("Huobi secret key is required for private requests")
+        mac = self._hmac_proto.copy()
+        mac.update(b"\n".join((
+            method.encode(), self._host_bytes, path.encode(), query_string.encode()
+        )))
+        return mac.hexdigest()
 
     async def _request(
         self,
@@ -136,58 +283,100 @@ class HuobiAPI(BaseExchange):
         if params is None:
             params = {}
         
-        await self.rate_limiter.acquire()
-        
         if private:
             params["AccessKeyId"] = self.api_key
             params["SignatureMethod"] = "HmacSHA256"
             params["SignatureVersion"] = "2"
-            params["Timestamp"] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S")
-            
-            query_string = "&".join(
-                f"{k}={urllib.parse.quote(str(v), safe='')}"
-                for k, v in sorted(params.items())
-            )
-            
+            params["Timestamp"] = _ts_iso()
+        
+        # Encode the query once; the same string is signed and sent
+        query_string = urllib.parse.urlencode(
+            sorted(params.items()), quote_via=urllib.parse.quote, safe=""
+        )
+        
+        if private:
             signature = self._get_signature(method, endpoint, query_string)
-            params["Signature"] = signature
+            query_string += "&Signature=" + urllib.parse.quote(signature, safe="")
         
         url = f"{self.rest_base}{endpoint}"
+        if query_string:
+            # encoded=True stops yarl from re-quoting what was signed
+            url = URL(f"{url}?{query_string}", encoded=True)
+        session = self._get_session()
         
         max_retries = 3
-        retry_count = 0
+        idempotent = method == "GET"
         
-        while retry_count < max_retries:
+        for attempt in range(max_retries):
             try:
-                async with self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    json=data,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    result = await response.json()
-                    
-                    if result.get("status") == "ok":
-                        await self._emit_llm_callback("on_market_data", {
-                            "exchange": "huobi",
-                            "endpoint": endpoint,
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
-                        return result.get("data", result)
-                    elif result.get("code") == 429:
-                        await asyncio.sleep(2 ** retry_count)
-                        retry_count += 1
-                    else:
-                        raise Exception(f"API Error: {result.get('message', 'Unknown')}")
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= max_retries:
+                # Bounded concurrency, then a rate-limit token per attempt
+                async with self._request_slots:
+                    await self.rate_limiter.acquire()
+                    async with session.request(method, url, json=data) as response:
+                        # Server says the quota is spent: make the next callers wait
+                        if response.headers.get("X-HB-RateLimit-Requests-Remain") == "0":
+                            self.rate_limiter.drain()
+                        
+                        if response.status == 429:
+                            wait_time = retry_after(response.headers.get("Retry-After"), _backoff(attempt))
+                        elif response.status >= 500:
+                            if not idempotent:
+                                raise Exception(
+                                    f"API Error: HTTP {response.status} on {method} {endpoint}, not retried"
+                                )
+                            wait_time = _backoff(attempt)
+                        elif response.status >= 400:
+                            # Bad request, auth or signature errors never heal on retry
+                            raise Exception(f"API Error: HTTP {response.status}")
+                        else:
+                            # Parse the raw bytes: no str decode, no content-type check
+                            result = json_loads(await response.read())
+                            
+                            if result.get("status") == "ok":
+                                self._emit_llm_callback("on_market_data", {
+                                    "exchange": "huobi",
+                                    "endpoint": endpoint,
+                                    "timestamp": _ts_iso()
+                                })
+                                return result.get("data", result)
+                            elif result.get("code") == 429:
+                                wait_time = _backoff(attempt)
+                            else:
+                                raise Exception(
+                                    f"API Error: {result.get('err-msg') or result.get('message', 'Unknown')}"
+                                )
+            except _RETRYABLE_ERRORS as e:
+                # Only a failed connect proves a non-GET request was never sent
+                if attempt == max_retries - 1 or not (
+                    idempotent or isinstance(e, aiohttp.ClientConnectorError)
+                ):
                     raise
-                await asyncio.sleep(2 ** retry_count)
+                wait_time = _backoff(attempt)
+            
+            # Back off outside the slot; the next attempt takes a fresh token
+            if attempt < max_retries - 1:
+                logger.warning(f"Huobi {endpoint} retry {attempt + 1}/{max_retries - 1} in {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
         
         raise Exception("Max retries exceeded")
 
+    async def _get_account_id(self) -> Optional[str]:
+        """Return the first account id, fetching /account/accounts only once
+        
+        The id never changes for an API key, so it is cached for the life of
+        the client; concurrent first callers share a single lookup.
+        """
+        if self._account_id is not None:
+            return self._account_id
+        
+        async with self._account_id_lock:
+            if self._account_id is None:
+                accounts = await self._request("GET", "/account/accounts", {}, private=True)
+                if isinstance(accounts, list) and len(accounts) > 0:
+                    self._account_id = accounts[0]["id"]
+        
+        return self._account_id
+
     async def get_price(self, symbol: str) -> float:
         """Get current price"""
         data = await self._request("GET", "/market/detail/merged", {"symbol": symbol})
@@ -212,7 +401,7 @@ class HuobiAPI(BaseExchange):
             timestamp=datetime.utcnow()
         )
         
-        await self._emit_llm_callback("on_ticker_update", {
+        self._emit_llm_callback("on_ticker_update", {
             "symbol": symbol,
             "last_price": ticker.last_price,
             "volume_24h": ticker.volume_24h
@@ -220,6 +409,34 @@ class HuobiAPI(BaseExchange):
         
         return ticker
 
+    async def get_all_tickers(self) -> Dict[str, Ticker]:
+        """Get every symbol's 24-hour ticker in one /market/tickers request"""
+        data = await self._request("GET", "/market/tickers")
+        now = datetime.utcnow()
+        
+        return {
+            row["symbol"]: Ticker(
+                symbol=row["symbol"],
+                last_price=float(row.get("close") or 0),
+                bid=float(row.get("bid") or 0),
+                ask=float(row.get("ask") or 0),
+                high_24h=float(row.get("high") or 0),
+                low_24h=float(row.get("low") or 0),
+                volume_24h=float(row.get("vol") or 0),
+                timestamp=now
+            )
+            for row in (data if isinstance(data, list) else [])
+        }
+
+    async def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Get prices for several symbols concurrently
+        
+        Concurrency is bounded by the request slots and rate limiter in
+        _request; use get_all_tickers when most symbols are wanted.
+        """
+        prices = await asyncio.gather(*(self.get_price(symbol) for symbol in symbols))
+        return dict(zip(symbols, prices))
+
     async def get_historical_data(
         self,
         symbol: str,
@@ -227,6 +444,22 @@ class HuobiAPI(BaseExchange):
         limit: int = 100
     ) -> List[OHLCV]:
         """Get historical OHLCV data"""
+        batch = await self.get_historical_batch(symbol, timeframe, limit)
+        return batch.as_ohlcv_list()
+
+    async def get_historical_batch(
+        self,
+        symbol: str,
+        timeframe: str = "1day",
+        limit: int = 100
+    ) -> OHLCVBatch:
+        """Get historical candles as numpy columns
+        
+        Up to 2000 candles land in one float64 array instead of one OHLCV
+        object (and six float() calls) per candle.
+        """
+        import numpy as np
+        
         data = await self._request(
             "GET",
             "/market/history/kline",
@@ -237,21 +470,20 @@ class HuobiAPI(BaseExchange):
             }
         )
         
-        ohlcvs = []
         candles = data if isinstance(data, list) else []
-        
-        for candle in candles:
-            ohlcv = OHLCV(
-                timestamp=datetime.fromtimestamp(candle.get("id", 0)),
-                open=float(candle.get("open", 0)),
-                high=float(candle.get("high", 0)),
-                low=float(candle.get("low", 0)),
-                close=float(candle.get("close", 0)),
-                volume=float(candle.get("vol", 0))
-            )
-            ohlcvs.append(ohlcv)
-        
-        return ohlcvs
+        if not candles:
+            empty = np.empty(0, dtype=np.float64)
+            return OHLCVBatch(np.empty(0, dtype="datetime64[s]"), empty, empty, empty, empty, empty)
+        
+        arr = np.array(list(map(_KLINE_FIELDS, candles)), dtype=np.float64)
+        return OHLCVBatch(
+            timestamp=arr[:, 0].astype(np.int64).astype("datetime64[s]"),
+            open=arr[:, 1],
+            high=arr[:, 2],
+            low=arr[:, 3],
+            close=arr[:, 4],
+            volume=arr[:, 5]
+        )
 
     async def place_order(self, order: Order) -> Dict[str, Any]:
         """Place order"""
@@ -259,10 +491,7 @@ class HuobiAPI(BaseExchange):
         if not order.price:
             order_type = "buy-market" if order.side == Side.BUY else "sell-market"
         
-        # Get account ID first
-        accounts = await self._request("GET", "/account/accounts", {}, private=True)
-        account_id = accounts[0]["id"] if isinstance(accounts, list) and len(accounts) > 0 else None
-        
+        account_id = await self._get_account_id()
         if not account_id:
             raise Exception("No account found")
         
@@ -284,14 +513,14 @@ class HuobiAPI(BaseExchange):
             private=True
         )
         
-        await self._emit_llm_callback("on_order", {
+        self._emit_llm_callback("on_order", {
             "exchange": "huobi",
             "action": "place",
             "symbol": order.symbol,
             "side": order.side.value,
             "quantity": order.quantity,
             "price": order.price,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _ts_iso()
         })
         
         return response
@@ -305,11 +534,11 @@ class HuobiAPI(BaseExchange):
             private=True
         )
         
-        await self._emit_llm_callback("on_order", {
+        self._emit_llm_callback("on_order", {
             "exchange": "huobi",
             "action": "cancel",
             "order_id": order_id,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _ts_iso()
         })
         
         return response
@@ -340,10 +569,9 @@ class HuobiAPI(BaseExchange):
 
     async def get_balance(self, asset: str) -> Dict[str, float]:
         """Get account balance"""
-        accounts = await self._request("GET", "/account/accounts", {}, private=True)
+        account_id = await self._get_account_id()
         
-        if isinstance(accounts, list) and len(accounts) > 0:
-            account_id = accounts[0]["id"]
+        if account_id:
             balances = await self._request(
                 "GET",
                 f"/account/accounts/{account_id}/balance",
@@ -401,82 +629,124 @@ class HuobiAPI(BaseExchange):
         return {}
     async def subscribe_ticker(self, symbol: str, callback: Callable) -> None:
         """Subscribe to ticker updates"""
-        stream_name = f"ticker.{symbol}"
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
-        self.subscriptions[stream_name].append(callback)
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
+        self._subscribe(f"ticker.{symbol}", f"market.{symbol}.detail", callback)
 
     async def subscribe_trades(self, symbol: str, callback: Callable) -> None:
         """Subscribe to trades"""
-        stream_name = f"trade.{symbol}"
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
-        self.subscriptions[stream_name].append(callback)
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
+        self._subscribe(f"trade.{symbol}", f"market.{symbol}.trade.detail", callback)
 
     async def subscribe_order_book(self, symbol: str, callback: Callable, depth: int = 20) -> None:
         """Subscribe to order book"""
-        stream_name = f"depth.{depth}.{symbol}"
-        if stream_name not in self.subscriptions:
-            self.subscriptions[stream_name] = []
-        self.subscriptions[stream_name].append(callback)
-        if stream_name not in self.ws_connections:
-            asyncio.create_task(self._maintain_ws(stream_name))
-
-    async def _maintain_ws(self, stream_name: str) -> None:
-        """Maintain WebSocket connection"""
-        reconnect_delay = 1
-        max_reconnect_delay = 60
-        
-        while stream_name in self.subscriptions:
+        self._subscribe(f"depth.{depth}.{symbol}", f"market.{symbol}.depth.step0", callback)
+
+    def _subscribe(self, stream_name: str, topic: str, callback: Callable) -> None:
+        """Register a callback and subscribe its topic on the shared WebSocket
+        
+        topic is the Huobi channel, built by the caller so nothing is parsed
+        on (re)connect. The first subscription starts _maintain_ws; later
+        ones are sent on the live socket, or picked up when it reconnects.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_CALLBACK_QUEUE_SIZE)
+        self._callback_queues.setdefault(stream_name, []).append(queue)
+        self._callback_workers.append(asyncio.create_task(self._run_callback(callback, queue)))
+        
+        if stream_name in self.subscriptions:
+            self.subscriptions[stream_name].append(callback)
+            return
+        
+        self.subscriptions[stream_name] = [callback]
+        streams = self._topic_streams.setdefault(topic, [])
+        streams.append(stream_name)
+        if len(streams) > 1:
+            # Topic already subscribed for another stream; its frames now reach this one too
+            return
+        
+        if self._ws_task is None:
+            self._ws_task = asyncio.create_task(self._maintain_ws())
+            return
+        
+        ws = self.ws_connections.get(self.ws_base)
+        if ws is not None:
+            task = asyncio.create_task(self._send_subscribe(ws, topic))
+            self._sub_tasks.add(task)
+            task.add_done_callback(self._sub_tasks.discard)
+
+    async def _send_subscribe(self, ws: aiohttp.ClientWebSocketResponse, topic: str) -> None:
+        """Send one topic subscription on the shared socket"""
+        try:
+            await ws.send_str(json_dumps_str({"sub": topic, "id": str(next(self._sub_ids))}))
+        except ConnectionResetError:
+            # Socket is going down; the reconnect resubscribes every topic
+            logger.warning(f"WebSocket closing, deferring subscribe to {topic}")
+
+    async def _maintain_ws(self) -> None:
+        """Maintain the WebSocket shared by all subscriptions"""
+        failures = 0
+        
+        while self.subscriptions:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.ws_connect(self.ws_base) as ws:
-                        self.ws_connections[stream_name] = ws
-                        reconnect_delay = 1
-                        
-                        channel = stream_name.split(".")[0]
-                        symbol = ".".join(stream_name.split(".")[1:])
-                        
-                        if channel == "ticker":
-                            sub_msg = f"market.{symbol}.detail"
-                        elif channel == "trade":
-                            sub_msg = f"market.{symbol}.trade.detail"
+                # Reuse the pooled session: no new connector/DNS cache per reconnect.
+                # Huobi gzips frames itself, so permessage-deflate stays off.
+                async with self._get_session().ws_connect(
+                    self.ws_base,
+                    heartbeat=20,
+                    compress=0,
+                    max_msg_size=0
+                ) as ws:
+                    self.ws_connections[self.ws_base] = ws
+                    failures = 0
+                    
+                    for topic in list(self._topic_streams):
+                        await self._send_subscribe(ws, topic)
+                    logger.info(f"WebSocket connected: {len(self._topic_streams)} topics")
+                    
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.BINARY:
+                            # Each frame is a complete gzip member, so a one-shot
+                            # zlib.decompress beats a decompressobj carried across frames
+                            data = json_loads(zlib.decompress(msg.data, _GZIP_WBITS))
+                        elif msg.type == aiohttp.WSMsgType.TEXT:
+                            data = json_loads(msg.data)
+                        elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
+                            break
                         else:
-                            sub_msg = f"market.{symbol}.depth.step0"
+                            continue
                         
-                        subscribe_msg = {
-                            "sub": sub_msg,
-                            "id": str(int(time.time() * 1000))
-                        }
-                        await ws.send_json(subscribe_msg)
-                        logger.info(f"WebSocket connected: {stream_name}")
+                        # Application-level keepalive: the server drops us without a pong
+                        if "ping" in data:
+                            await ws.send_str(json_dumps_str({"pong": data["ping"]}))
+                            continue
                         
-                        async for msg in ws:
-                            if msg.type == aiohttp.WSMsgType.TEXT:
-                                data = json.loads(msg.data)
-                                await self._process_ws_message(stream_name, data)
-                            elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
-                                break
+                        for stream_name in self._topic_streams.get(data.get("ch"), ()):
+                            self._process_ws_message(stream_name, data)
             except Exception as e:
-                logger.error(f"WebSocket error ({stream_name}): {e}")
-                if stream_name in self.ws_connections:
-                    del self.ws_connections[stream_name]
-                await asyncio.sleep(reconnect_delay)
-                reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
-
-    async def _process_ws_message(self, stream_name: str, data: Dict) -> None:
-        """Process WebSocket message"""
-        try:
-            if stream_name not in self.subscriptions:
-                return
-            for callback in self.subscriptions[stream_name]:
+                logger.error(f"WebSocket error: {e}")
+                await asyncio.sleep(_backoff(failures))
+                failures += 1
+            finally:
+                self.ws_connections.pop(self.ws_base, None)
+        
+        self._ws_task = None
+
+    def _process_ws_message(self, stream_name: str, data: Dict) -> None:
+        """Hand a WebSocket update to each of the stream's callback queues
+        
+        Never waits: when a callback has fallen _CALLBACK_QUEUE_SIZE updates
+        behind, its oldest update is dropped to make room.
+        """
+        for queue in self._callback_queues.get(stream_name, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(data)
+
+    async def _run_callback(self, callback: Callable, queue: asyncio.Queue) -> None:
+        """Feed one callback its queued updates in order"""
+        while True:
+            data = await queue.get()
+            try:
                 await callback(data)
-        except Exception as e:
-            logger.error(f"Error processing WS message: {e}")
+            except Exception as e:
+                logger.error(f"Error processing WS message: {e}")
 
     async def get_recent_trades(self, symbol: str, limit: int = 100) -> List[Dict]:
         """Get recent trades"""
@@ -485,9 +755,8 @@ class HuobiAPI(BaseExchange):
 
     async def get_account_trades(self, symbol: Optional[str] = None, limit: int = 50) -> List[Dict]:
         """Get account trades"""
-        accounts = await self._request("GET", "/account/accounts", {}, private=True)
-        if isinstance(accounts, list) and len(accounts) > 0:
-            account_id = accounts[0]["id"]
+        account_id = await self._get_account_id()
+        if account_id:
             params = {"account-id": account_id, "size": limit}
             if symbol:
                 params["symbol"] = symbol
@@ -527,10 +796,9 @@ class HuobiAPI(BaseExchange):
         }
 
     async def validate_symbol(self, symbol: str) -> bool:
-        """Validate symbol"""
+        """Validate symbol against the cached online symbol set"""
         try:
-            await self.get_price(symbol)
-            return True
+            return symbol in await self._online_symbols()
         except Exception:
             return False
 
@@ -546,14 +814,24 @@ class HuobiAPI(BaseExchange):
         return await self._request("GET", "/linear-swap-api/v1/position_info", {})
 
     async def get_available_symbols(self) -> List[str]:
-        """Get available symbols"""
+        """Get available symbols (cached for _SYMBOLS_TTL seconds)"""
+        await self._online_symbols()
+        return list(self._symbols_cache[1])
+
+    async def _online_symbols(self) -> FrozenSet[str]:
+        """Return the set of online symbols, refreshing it once the TTL expires"""
+        if self._symbols_cache and time.monotonic() - self._symbols_cache[0] < _SYMBOLS_TTL:
+            return self._symbols_cache[2]
+        
         data = await self._request("GET", "/v1/common/symbols")
         symbols = []
         if isinstance(data, list):
             for symbol_info in data:
                 if symbol_info.get("state") == "online":
                     symbols.append(symbol_info.get("symbol"))
-        return symbols
+        
+        self._symbols_cache = (time.monotonic(), symbols, frozenset(symbols))
+        return self._symbols_cache[2]
 
     async def amend_order(self, order_id: str, new_amount: Optional[float] = None) -> Dict[str, Any]:
         """Amend order"""
@@ -34,6 +34,12 @@ from pathlib import Path
 # Third-party imports
 from dotenv import load_dotenv
 
+# Optional libuv-backed event loop for the aiohttp REST/WebSocket hot paths
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Load environment variables
 load_dotenv()
 
@@ -560,6 +566,9 @@ if __name__ == "__main__":
         """)
         
         # Run the application
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("⚡ Using uvloop event loop")
         asyncio.run(main())
     
     except KeyboardInterrupt:
@@ -0,0 +1,142 @@
+"""Shared fakes for the exchange adapter tests.
+
+FakeSession stands in for aiohttp.ClientSession: each request pops the
+next scripted outcome, so adapters are exercised through their public
+methods without network access.
+
+Author: v0-strategy-engine-pro
+Version: 1.0
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import pytest
+
+
+class FakeResponse:
+    """Minimal aiohttp response: status, headers and a JSON body"""
+    
+    def __init__(self, body: Any = None, status: int = 200, headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.headers = headers or {}
+        self.request_info = SimpleNamespace(real_url="https://fake.exchange")
+        self.history = ()
+        self._body = json.dumps(body if body is not None else {}).encode()
+    
+    async def read(self) -> bytes:
+        return self._body
+    
+    async def json(self, **kwargs) -> Any:
+        return json.loads(self._body)
+    
+    async def text(self) -> str:
+        return self._body.decode()
+    
+    def release(self) -> None:
+        pass
+
+
+class _Exchange:
+    """Async context manager returned by FakeSession.request"""
+    
+    def __init__(self, outcome: Any):
+        self.outcome = outcome
+    
+    async def __aenter__(self) -> FakeResponse:
+        if isinstance(self.outcome, BaseException):
+            raise self.outcome
+        return self.outcome
+    
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+
+class FakeWebSocket:
+    """Records sent frames and yields fed messages until closed
+    
+    Set gate to an unset asyncio.Event to make sends block, as on a
+    congested socket.
+    """
+    
+    def __init__(self):
+        self.sent: List[Any] = []
+        self.closed = False
+        self.gate: Optional[asyncio.Event] = None
+        self._incoming: asyncio.Queue = asyncio.Queue()
+    
+    def feed(self, data: Any, msg_type: aiohttp.WSMsgType = aiohttp.WSMsgType.TEXT) -> None:
+        self._incoming.put_nowait(SimpleNamespace(type=msg_type, data=data))
+    
+    async def send_str(self, data: str) -> None:
+        if self.gate is not None:
+            await self.gate.wait()
+        self.sent.append(data)
+    
+    async def close(self) -> None:
+        self.closed = True
+        self._incoming.put_nowait(None)
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        msg = await self._incoming.get()
+        if msg is None:
+            raise StopAsyncIteration
+        return msg
+    
+    async def __aenter__(self) -> "FakeWebSocket":
+        return self
+    
+    async def __aexit__(self, *exc) -> bool:
+        await self.close()
+        return False
+
+
+class FakeSession:
+    """Replays one scripted response or exception per request"""
+    
+    def __init__(self, *outcomes: Any):
+        self.outcomes = list(outcomes)
+        self.requests: List[Tuple[str, str, Dict[str, Any]]] = []
+        self.websockets: List[FakeWebSocket] = []
+        self.closed = False
+    
+    def request(self, method: str, url: Any, **kwargs) -> _Exchange:
+        self.requests.append((method, str(url), kwargs))
+        if not self.outcomes:
+            raise AssertionError(f"unexpected {method} {url}")
+        return _Exchange(self.outcomes.pop(0))
+    
+    def get(self, url: Any, **kwargs) -> _Exchange:
+        return self.request("GET", url, **kwargs)
+    
+    def post(self, url: Any, **kwargs) -> _Exchange:
+        return self.request("POST", url, **kwargs)
+    
+    def delete(self, url: Any, **kwargs) -> _Exchange:
+        return self.request("DELETE", url, **kwargs)
+    
+    def ws_connect(self, url: Any, **kwargs) -> FakeWebSocket:
+        self.websockets.append(FakeWebSocket())
+        return self.websockets[-1]
+    
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Record asyncio.sleep delays instead of waiting them out"""
+    delays: List[float] = []
+    
+    async def fake_sleep(delay, result=None):
+        delays.append(delay)
+        return result
+    
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
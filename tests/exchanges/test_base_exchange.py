@@ -0,0 +1,194 @@
+"""
+Shared Exchange Helper Test Suite
+
+Covers the helpers in base_exchange used by every exchange adapter.
+
+Author: v0-strategy-engine-pro
+License: MIT
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import exchanges.base_exchange as base_exchange
+from exchanges.base_exchange import (
+    LLMEventQueue,
+    TokenBucket,
+    format_decimal,
+    format_quantity,
+    retry_after,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock that asyncio.sleep advances instead of waiting
+    
+    Only base_exchange's view of time is replaced, so the event loop keeps
+    its real clock. Each sleep still yields so other waiters can run. Rates
+    are powers of two so the clock arithmetic stays exact.
+    """
+    state = SimpleNamespace(now=1000.0, sleeps=[])
+    real_sleep = asyncio.sleep
+    
+    async def fake_sleep(delay, result=None):
+        state.sleeps.append(delay)
+        state.now += delay
+        await real_sleep(0)
+        return result
+    
+    monkeypatch.setattr(base_exchange, "time", SimpleNamespace(monotonic=lambda: state.now))
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return state
+
+
+class TestTokenBucket:
+    """Acquires are paced at the refill rate once the burst is spent"""
+    
+    @pytest.mark.asyncio
+    async def test_full_bucket_admits_capacity_without_waiting(self, clock):
+        bucket = TokenBucket(capacity=5, refill_per_sec=1)
+        
+        for _ in range(5):
+            await bucket.acquire()
+        
+        assert clock.sleeps == []
+    
+    @pytest.mark.asyncio
+    async def test_empty_bucket_waits_for_one_refill(self, clock):
+        bucket = TokenBucket(capacity=2, refill_per_sec=4)
+        
+        for _ in range(3):
+            await bucket.acquire()
+        
+        assert sum(clock.sleeps) == pytest.approx(0.25)
+    
+    @pytest.mark.asyncio
+    async def test_idle_refill_is_capped_at_capacity(self, clock):
+        bucket = TokenBucket(capacity=2, refill_per_sec=8)
+        clock.now += 60
+        
+        for _ in range(3):
+            await bucket.acquire()
+        
+        # 60s idle still only banks 2 tokens, so the third call waits
+        assert sum(clock.sleeps) == pytest.approx(0.125)
+    
+    @pytest.mark.asyncio
+    async def test_drain_forces_the_next_acquire_to_wait(self, clock):
+        bucket = TokenBucket(capacity=5, refill_per_sec=16)
+        bucket.drain()
+        
+        await bucket.acquire()
+        
+        assert sum(clock.sleeps) == pytest.approx(0.0625)
+    
+    @pytest.mark.asyncio
+    async def test_contended_acquires_are_paced_and_fifo(self, clock):
+        bucket = TokenBucket(capacity=2, refill_per_sec=16)
+        order = []
+        
+        async def take(i):
+            await bucket.acquire()
+            order.append(i)
+        
+        await asyncio.gather(*(take(i) for i in range(6)))
+        
+        # 2 from the full bucket, 4 more refilled at 16/s
+        assert order == list(range(6))
+        assert sum(clock.sleeps) == pytest.approx(0.25)
+
+
+class TestRetryAfter:
+    """Retry-After seconds are honoured, anything unusable falls back"""
+    
+    @pytest.mark.parametrize("header, expected", [
+        ("3", 3.0),
+        ("0.5", 0.5),
+        ("-2", 0.0),
+        (None, 1.5),
+        ("Wed, 21 Oct 2026 07:28:00 GMT", 1.5),
+    ])
+    def test_header_or_default(self, header, expected):
+        assert retry_after(header, 1.5) == expected
+
+
+class TestFormatting:
+    """Prices round to the symbol precision, quantities truncate"""
+    
+    @pytest.mark.parametrize("value, decimals, expected", [
+        (42000.129, 2, "42000.13"),
+        (0.5, 4, "0.5000"),
+        (42000.5, 0, "42000"),
+        (42000.129, None, "42000.129"),
+    ])
+    def test_format_decimal(self, value, decimals, expected):
+        assert format_decimal(value, decimals) == expected
+    
+    @pytest.mark.parametrize("value, decimals, expected", [
+        (0.99999, 4, "0.9999"),
+        (0.123456789, 6, "0.123456"),
+        (2.7, 0, "2"),
+        (0.00001, 8, "0.00001000"),
+        (0.5, None, "0.5"),
+    ])
+    def test_format_quantity_rounds_down(self, value, decimals, expected):
+        assert format_quantity(value, decimals) == expected
+
+
+class TestLLMEventQueue:
+    """Events run in order off the caller's path and never block put()"""
+    
+    @pytest.mark.asyncio
+    async def test_events_run_in_order(self):
+        seen = asyncio.Queue()
+        events = LLMEventQueue(lambda event, payload: seen.put((event, payload)), maxsize=10)
+        
+        events.put("on_order", {"id": 1})
+        events.put("on_trade", {"id": 2})
+        
+        assert await asyncio.wait_for(seen.get(), 1) == ("on_order", {"id": 1})
+        assert await asyncio.wait_for(seen.get(), 1) == ("on_trade", {"id": 2})
+        await events.close()
+    
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        seen = asyncio.Queue()
+        events = LLMEventQueue(lambda event, payload: seen.put(payload["id"]), maxsize=2)
+        
+        # The worker only starts once this task yields, so the queue fills up
+        for i in range(4):
+            events.put("on_market_data", {"id": i})
+        
+        assert [await asyncio.wait_for(seen.get(), 1) for _ in range(2)] == [2, 3]
+        assert events.dropped == 2
+        await events.close()
+    
+    @pytest.mark.asyncio
+    async def test_handler_error_does_not_stop_the_worker(self):
+        seen = asyncio.Queue()
+        
+        async def handler(event, payload):
+            if payload.get("fail"):
+                raise RuntimeError("callback failed")
+            await seen.put(payload)
+        
+        events = LLMEventQueue(handler, maxsize=10)
+        events.put("on_signal", {"fail": True})
+        events.put("on_signal", {"id": 1})
+        
+        assert await asyncio.wait_for(seen.get(), 1) == {"id": 1}
+        await events.close()
+    
+    @pytest.mark.asyncio
+    async def test_close_stops_the_worker(self):
+        events = LLMEventQueue(lambda event, payload: asyncio.sleep(0), maxsize=10)
+        events.put("on_order", {})
+        
+        await events.close()
+        await events.close()
+        
+        current = asyncio.current_task()
+        assert [t for t in asyncio.all_tasks() if t is not current and not t.done()] == []
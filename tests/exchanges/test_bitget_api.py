@@ -0,0 +1,151 @@
+"""Unit Tests for the Bitget adapter.
+
+Requests go through a scripted FakeSession (see conftest.py), so these
+cover request building, retries and response handling offline.
+
+Author: v0-strategy-engine-pro
+Version: 1.0
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import aiohttp
+import pytest
+
+from exchanges.base_exchange import Side
+from exchanges.bitget_api import BitgetAPI
+
+from conftest import FakeResponse, FakeSession
+
+
+def make_client(*outcomes) -> BitgetAPI:
+    client = BitgetAPI(api_key="key", secret_key="secret", passphrase="pass")
+    client.session = FakeSession(*outcomes)
+    return client
+
+
+def ok(data):
+    return FakeResponse({"code": "00000", "data": data})
+
+
+CATALOG = ok([
+    {"symbol": "BTCUSDT", "baseCoin": "BTC", "quoteCoin": "USDT", "status": "online",
+     "priceScale": "2", "quantityScale": "4"},
+    {"symbol": "OLDUSDT", "baseCoin": "OLD", "quoteCoin": "USDT", "status": "offline",
+     "priceScale": "4", "quantityScale": "0"},
+])
+
+
+class TestSymbolCatalog:
+    """Rules and symbol lists share one cached catalog fetch"""
+    
+    @pytest.mark.asyncio
+    async def test_rules_and_symbols_share_one_fetch(self):
+        client = make_client(CATALOG)
+        
+        rules = await client.get_trading_rules()
+        symbols = await client.get_available_symbols()
+        
+        assert set(rules) == {"BTCUSDT", "OLDUSDT"}
+        assert symbols == ["BTCUSDT"]
+        assert await client.validate_symbol("BTCUSDT")
+        assert not await client.validate_symbol("OLDUSDT")
+        assert len(client.session.requests) == 1
+    
+    @pytest.mark.asyncio
+    async def test_mutating_returned_rules_leaves_cache_intact(self):
+        client = make_client(CATALOG)
+        
+        rules = await client.get_trading_rules()
+        rules["BTCUSDT"]["filters"]["minQty"] = "0"
+        del rules["OLDUSDT"]
+        
+        fresh = await client.get_trading_rules()
+        assert fresh["BTCUSDT"]["filters"]["minQty"] == "4"
+        assert "OLDUSDT" in fresh
+
+
+def make_order(quantity, price=None, symbol="BTCUSDT"):
+    return SimpleNamespace(symbol=symbol, side=Side.BUY, quantity=quantity, price=price)
+
+
+class TestOrderPrecision:
+    """Sizes are truncated and prices rounded to the symbol's scales"""
+    
+    @pytest.mark.asyncio
+    async def test_fresh_client_loads_scales_before_first_order(self):
+        client = make_client(CATALOG, ok({"orderId": "1"}))
+        
+        await client.place_order(make_order(0.123456789, price=42000.129))
+        
+        method, url, kwargs = client.session.requests[1]
+        assert method == "POST"
+        assert kwargs["json"]["size"] == "0.1234"
+        assert kwargs["json"]["price"] == "42000.13"
+    
+    @pytest.mark.asyncio
+    async def test_size_is_truncated_not_rounded(self):
+        client = make_client(CATALOG, ok({"orderId": "1"}))
+        
+        await client.place_order(make_order(0.99999))
+        
+        assert client.session.requests[1][2]["json"]["size"] == "0.9999"
+    
+    @pytest.mark.asyncio
+    async def test_catalog_is_fetched_once_for_many_orders(self):
+        client = make_client(CATALOG, ok({"orderId": "1"}), ok({"orderId": "2"}))
+        
+        await client.place_order(make_order(1.5))
+        await client.place_order(make_order(2.5))
+        
+        assert len(client.session.requests) == 3
+
+
+PLACED = ok({"orderId": "1"})
+
+
+class TestRetries:
+    """Order POSTs must not be resent once they may have reached Bitget"""
+    
+    @pytest.mark.asyncio
+    async def test_post_not_resent_after_timeout(self, no_sleep):
+        client = make_client(CATALOG, asyncio.TimeoutError(), PLACED)
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await client.place_order(make_order(0.5))
+        
+        assert [method for method, _, _ in client.session.requests] == ["GET", "POST"]
+    
+    @pytest.mark.asyncio
+    async def test_post_not_resent_after_disconnect(self, no_sleep):
+        client = make_client(CATALOG, aiohttp.ServerDisconnectedError(), PLACED)
+        
+        with pytest.raises(aiohttp.ServerDisconnectedError):
+            await client.place_order(make_order(0.5))
+        
+        assert len(client.session.requests) == 2
+    
+    @pytest.mark.asyncio
+    async def test_post_resent_when_connect_failed(self, no_sleep):
+        refused = aiohttp.ClientConnectorError(Mock(), OSError("connection refused"))
+        client = make_client(CATALOG, refused, PLACED)
+        
+        assert await client.place_order(make_order(0.5)) == {"orderId": "1"}
+        assert [method for method, _, _ in client.session.requests] == ["GET", "POST", "POST"]
+    
+    @pytest.mark.asyncio
+    async def test_rate_limited_post_waits_retry_after(self, no_sleep):
+        limited = FakeResponse({"code": "40429", "msg": "Too Many Requests"}, headers={"Retry-After": "2"})
+        client = make_client(CATALOG, limited, PLACED)
+        
+        assert await client.place_order(make_order(0.5)) == {"orderId": "1"}
+        assert no_sleep == [2.0]
+    
+    @pytest.mark.asyncio
+    async def test_get_resent_after_timeout(self, no_sleep):
+        client = make_client(asyncio.TimeoutError(), CATALOG)
+        
+        assert await client.get_available_symbols() == ["BTCUSDT"]
+        assert len(client.session.requests) == 2
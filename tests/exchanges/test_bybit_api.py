@@ -0,0 +1,232 @@
+"""Unit Tests for the Bybit adapter.
+
+Requests go through a scripted FakeSession (see conftest.py), so these
+cover request building, retries and response handling offline.
+
+Author: v0-strategy-engine-pro
+Version: 1.0
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+import pytest
+
+from exchanges.base_exchange import Side
+from exchanges.bybit_api import BybitAPI
+
+from conftest import FakeResponse, FakeSession
+
+
+def make_client(*outcomes) -> BybitAPI:
+    client = BybitAPI(api_key="key", secret_key="secret")
+    client.session = FakeSession(*outcomes)
+    return client
+
+
+def make_order(quantity=0.5, price=None):
+    return SimpleNamespace(symbol="BTCUSDT", side=Side.BUY, quantity=quantity, price=price)
+
+
+OK = FakeResponse({"retCode": 0, "result": {"orderId": "1"}})
+
+
+def expected_sign(headers, payload: bytes) -> str:
+    """Bybit v5: HMAC of timestamp + api_key + recv_window + (query | body)"""
+    prefix = (headers["X-BAPI-TIMESTAMP"] + "key" + headers["X-BAPI-RECV-WINDOW"]).encode()
+    return hmac.new(b"secret", prefix + payload, hashlib.sha256).hexdigest()
+
+
+class TestSigning:
+    """The signature must cover exactly the query string or body that is sent"""
+    
+    @pytest.mark.asyncio
+    async def test_get_signs_sent_query_string(self):
+        client = make_client(FakeResponse({"retCode": 0, "result": {"list": []}}))
+        
+        await client.get_open_orders("BTCUSDT")
+        
+        _, url, kwargs = client.session.requests[0]
+        query = url.split("?", 1)[1]
+        assert query == "category=spot&limit=50&openOnly=1&symbol=BTCUSDT"
+        assert kwargs["headers"]["X-BAPI-RECV-WINDOW"] == "5000"
+        assert kwargs["headers"]["X-BAPI-SIGN"] == expected_sign(kwargs["headers"], query.encode())
+    
+    @pytest.mark.asyncio
+    async def test_post_signs_sent_body_bytes(self):
+        client = make_client(OK)
+        
+        await client.place_order(make_order(price=42000.0))
+        
+        _, url, kwargs = client.session.requests[0]
+        assert "?" not in url
+        assert kwargs["headers"]["X-BAPI-SIGN"] == expected_sign(kwargs["headers"], kwargs["data"])
+
+
+class TestRetries:
+    """Non-GET requests must not be resent once they may have reached Bybit"""
+    
+    @pytest.mark.asyncio
+    async def test_post_not_resent_after_timeout(self, no_sleep):
+        client = make_client(asyncio.TimeoutError(), OK)
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await client.place_order(make_order())
+        
+        assert len(client.session.requests) == 1
+    
+    @pytest.mark.asyncio
+    async def test_post_not_resent_after_disconnect(self, no_sleep):
+        client = make_client(aiohttp.ServerDisconnectedError(), OK)
+        
+        with pytest.raises(aiohttp.ServerDisconnectedError):
+            await client.place_order(make_order())
+        
+        assert len(client.session.requests) == 1
+    
+    @pytest.mark.asyncio
+    async def test_post_resent_when_connect_failed(self, no_sleep):
+        refused = aiohttp.ClientConnectorError(Mock(), OSError("connection refused"))
+        client = make_client(refused, OK)
+        
+        assert await client.place_order(make_order()) == {"orderId": "1"}
+        assert len(client.session.requests) == 2
+    
+    @pytest.mark.asyncio
+    async def test_post_resent_after_rate_limit(self, no_sleep):
+        client = make_client(FakeResponse(status=429, headers={"Retry-After": "3"}), OK)
+        
+        assert await client.place_order(make_order()) == {"orderId": "1"}
+        assert len(client.session.requests) == 2
+        assert no_sleep == [3.0]
+    
+    @pytest.mark.asyncio
+    async def test_get_resent_after_timeout(self, no_sleep):
+        order = FakeResponse({"retCode": 0, "result": {"list": [{"orderId": "1"}]}})
+        client = make_client(asyncio.TimeoutError(), order)
+        
+        assert await client.get_order("1", "BTCUSDT") == {"orderId": "1"}
+        assert len(client.session.requests) == 2
+
+
+def tickers(symbol, last_price):
+    return FakeResponse({"retCode": 0, "result": {"list": [{"symbol": symbol, "lastPrice": last_price}]}})
+
+
+class TestLLMCallbacks:
+    """Deferred callbacks must each see their own payload"""
+    
+    @pytest.mark.asyncio
+    async def test_market_data_payloads_are_not_shared(self):
+        client = make_client(tickers("BTCUSDT", "42000"), tickers("ETHUSDT", "2500"))
+        seen = []
+        
+        async def store(payload):
+            seen.append(payload)
+        
+        client.register_llm_callback("on_market_data", store)
+        await client.get_price("BTCUSDT")
+        await client.get_price("ETHUSDT")
+        for _ in range(3):
+            await asyncio.sleep(0)
+        
+        assert len(seen) == 2
+        assert seen[0] is not seen[1]
+        assert seen[0]["endpoint"] == "market/tickers"
+
+
+class TestEmptyResponses:
+    """Empty or unknown-symbol replies come back as {} from _request"""
+    
+    @pytest.mark.asyncio
+    async def test_get_price_without_rows_raises_clear_error(self):
+        client = make_client(FakeResponse({"retCode": 0, "result": {}}))
+        
+        with pytest.raises(ValueError, match="no ticker for NOPEUSDT"):
+            await client.get_price("NOPEUSDT")
+    
+    @pytest.mark.asyncio
+    async def test_get_ticker_without_rows_raises_clear_error(self):
+        client = make_client(FakeResponse({"retCode": 0, "result": {"list": []}}))
+        
+        with pytest.raises(ValueError, match="no ticker for NOPEUSDT"):
+            await client.get_ticker("NOPEUSDT")
+    
+    @pytest.mark.asyncio
+    async def test_list_endpoints_return_empty(self):
+        client = make_client(
+            FakeResponse({"retCode": 0, "result": {}}),
+            FakeResponse({"retCode": 0, "result": {}}),
+        )
+        
+        assert await client.get_historical_data("BTCUSDT") == []
+        assert await client.get_recent_trades("BTCUSDT") == []
+
+
+async def settle(rounds=5):
+    """Let scheduled callbacks and tasks run a few loop iterations"""
+    for _ in range(rounds):
+        await asyncio.sleep(0)
+
+
+class TestSubscriptions:
+    """Live subscribes are batched per tick and never leak flush tasks"""
+    
+    @pytest.mark.asyncio
+    async def test_close_cancels_every_pending_subscribe_flush(self):
+        client = make_client()
+        await client.subscribe_ticker("BTCUSDT", AsyncMock())
+        await settle()
+        ws = client.session.websockets[0]
+        assert [json.loads(frame) for frame in ws.sent] == [{"op": "subscribe", "args": ["tickers.BTCUSDT"]}]
+        
+        # A congested socket holds the first flush while a second one queues
+        ws.gate = asyncio.Event()
+        await client.subscribe_ticker("ETHUSDT", AsyncMock())
+        await asyncio.sleep(0)
+        await client.subscribe_trades("ETHUSDT", AsyncMock())
+        await settle()
+        
+        await client.close()
+        
+        current = asyncio.current_task()
+        assert [t for t in asyncio.all_tasks() if t is not current and not t.done()] == []
+
+
+INSTRUMENT = FakeResponse({"retCode": 0, "result": {"list": [{
+    "symbol": "BTCUSDT",
+    "priceFilter": {"tickSize": "0.10"},
+    "lotSizeFilter": {"basePrecision": "0.000001"},
+}]}})
+
+
+class TestAmendPrecision:
+    """Amended quantities are truncated and prices rounded to the symbol's steps"""
+    
+    @pytest.mark.asyncio
+    async def test_fresh_client_loads_steps_before_amending(self):
+        client = make_client(INSTRUMENT, OK)
+        
+        await client.amend_order("1", "BTCUSDT", qty=0.1234569, price=42000.16)
+        
+        instrument_request, amend_request = client.session.requests
+        assert "market/instruments-info" in instrument_request[1]
+        assert "symbol=BTCUSDT" in instrument_request[1]
+        assert json.loads(amend_request[2]["data"]) == {
+            "category": "spot", "symbol": "BTCUSDT", "orderId": "1",
+            "qty": "0.123456", "price": "42000.2",
+        }
+    
+    @pytest.mark.asyncio
+    async def test_steps_are_fetched_once_per_symbol(self):
+        client = make_client(INSTRUMENT, OK, OK)
+        
+        await client.amend_order("1", "BTCUSDT", qty=0.5)
+        await client.amend_order("1", "BTCUSDT", qty=0.25)
+        
+        assert len(client.session.requests) == 3
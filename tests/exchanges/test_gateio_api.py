@@ -0,0 +1,226 @@
+"""Unit Tests for the Gate.io adapter.
+
+Requests go through a scripted FakeSession (see conftest.py), so these
+cover request building, retries and response handling offline.
+
+Author: v0-strategy-engine-pro
+Version: 1.0
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import aiohttp
+import pytest
+
+from exchanges.base_exchange import OHLCV, Side
+from exchanges.gateio_api import GateioAPI
+
+from conftest import FakeResponse, FakeSession
+
+
+def make_client(*outcomes) -> GateioAPI:
+    client = GateioAPI(api_key="key", secret_key="secret")
+    client.session = FakeSession(*outcomes)
+    return client
+
+
+def make_order(quantity=0.5, price=None):
+    return SimpleNamespace(symbol="BTC_USDT", side=Side.BUY, quantity=quantity, price=price)
+
+
+class TestRetries:
+    """Order POSTs must not be resent once they may have reached Gate.io"""
+    
+    @pytest.mark.asyncio
+    async def test_created_order_is_returned(self, no_sleep):
+        client = make_client(FakeResponse({"id": "1"}, status=201))
+        
+        assert await client.place_order(make_order()) == {"id": "1"}
+    
+    @pytest.mark.asyncio
+    async def test_post_not_resent_after_timeout(self, no_sleep):
+        client = make_client(asyncio.TimeoutError(), FakeResponse({"id": "1"}, status=201))
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await client.place_order(make_order())
+        
+        assert len(client.session.requests) == 1
+    
+    @pytest.mark.asyncio
+    async def test_post_not_resent_after_server_error(self, no_sleep):
+        client = make_client(FakeResponse(status=502), FakeResponse({"id": "1"}, status=201))
+        
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.place_order(make_order())
+        
+        assert len(client.session.requests) == 1
+    
+    @pytest.mark.asyncio
+    async def test_post_resent_when_connect_failed(self, no_sleep):
+        refused = aiohttp.ClientConnectorError(Mock(), OSError("connection refused"))
+        client = make_client(refused, FakeResponse({"id": "1"}, status=201))
+        
+        assert await client.place_order(make_order()) == {"id": "1"}
+        assert len(client.session.requests) == 2
+    
+    @pytest.mark.asyncio
+    async def test_rejection_is_not_retried(self, no_sleep):
+        client = make_client(FakeResponse({"label": "BALANCE_NOT_ENOUGH"}, status=400))
+        
+        with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+            await client.place_order(make_order())
+        
+        assert exc_info.value.status == 400
+        assert "BALANCE_NOT_ENOUGH" in exc_info.value.message
+        assert no_sleep == []
+    
+    @pytest.mark.asyncio
+    async def test_get_resent_after_timeout(self, no_sleep):
+        client = make_client(asyncio.TimeoutError(), FakeResponse({"id": "1"}))
+        
+        assert await client.get_order("1", "BTC_USDT") == {"id": "1"}
+        assert len(client.session.requests) == 2
+
+
+class TestOrderFanOut:
+    """Every order gets a result, an error or an unknown-outcome entry"""
+    
+    @pytest.mark.asyncio
+    async def test_batch_orders_reports_each_chunk(self, no_sleep):
+        placed = [{"succeeded": True, "id": str(i)} for i in range(10)]
+        client = make_client(FakeResponse(placed), asyncio.TimeoutError())
+        
+        results = await client.batch_orders([make_order() for _ in range(11)])
+        
+        assert results[:10] == placed
+        assert results[10]["succeeded"] is None
+        assert results[10]["label"] == "OUTCOME_UNKNOWN"
+        assert len(client.session.requests) == 2
+    
+    @pytest.mark.asyncio
+    async def test_batch_orders_marks_rejected_chunk_failed(self, no_sleep):
+        client = make_client(FakeResponse({"label": "INVALID_PARAM_VALUE"}, status=400))
+        
+        results = await client.batch_orders([make_order(), make_order()])
+        
+        assert [r["label"] for r in results] == ["REQUEST_FAILED", "REQUEST_FAILED"]
+        assert all(r["succeeded"] is False for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_place_orders_parallel_keeps_per_order_results(self, no_sleep):
+        client = make_client(
+            FakeResponse({"id": "1"}, status=201),
+            FakeResponse({"label": "BALANCE_NOT_ENOUGH"}, status=400),
+        )
+        
+        results = await client.place_orders_parallel([make_order(), make_order()])
+        
+        assert results[0] == {"id": "1"}
+        assert isinstance(results[1], aiohttp.ClientResponseError)
+
+
+# Row: [time, quote volume, close, high, low, open, base volume, closed]
+CANDLES = FakeResponse([
+    ["1700000000", "420.5", "3.0", "4.0", "1.0", "2.0", "150.25", "true"],
+    ["1700003600", "990.0", "5.5", "6.0", "2.5", "3.0", "180.0", "false"],
+])
+
+
+class TestCandles:
+    """Gate.io candle columns are remapped into OHLCV order"""
+    
+    @pytest.mark.asyncio
+    async def test_batch_columns_are_remapped(self):
+        client = make_client(CANDLES)
+        
+        batch = await client.get_historical_batch("BTC_USDT")
+        
+        assert len(batch) == 2
+        assert batch.open.tolist() == [2.0, 3.0]
+        assert batch.high.tolist() == [4.0, 6.0]
+        assert batch.low.tolist() == [1.0, 2.5]
+        assert batch.close.tolist() == [3.0, 5.5]
+        assert batch.volume.tolist() == [150.25, 180.0]
+    
+    @pytest.mark.asyncio
+    async def test_historical_data_returns_ohlcv_with_naive_utc_times(self):
+        client = make_client(CANDLES)
+        
+        candles = await client.get_historical_data("BTC_USDT")
+        
+        assert candles == [
+            OHLCV(datetime(2023, 11, 14, 22, 13, 20), 2.0, 4.0, 1.0, 3.0, 150.25),
+            OHLCV(datetime(2023, 11, 14, 23, 13, 20), 3.0, 6.0, 2.5, 5.5, 180.0),
+        ]
+        assert all(type(c.close) is float for c in candles)
+    
+    @pytest.mark.asyncio
+    async def test_empty_response_gives_empty_batch(self):
+        client = make_client(FakeResponse([]))
+        
+        batch = await client.get_historical_batch("BTC_USDT")
+        
+        assert len(batch) == 0
+        assert batch.as_ohlcv_list() == []
+
+
+async def subscribed(client, frames):
+    """Return the channel's socket once the debounced subscribe has gone out"""
+    async def sent():
+        while not client.session.websockets or len(client.session.websockets[-1].sent) < frames:
+            await asyncio.sleep(0.001)
+    
+    await asyncio.wait_for(sent(), 1)
+    return client.session.websockets[-1]
+
+
+def book_update(pair, level):
+    return json.dumps({
+        "time": 1700000000, "channel": "spot.order_book", "event": "update",
+        "result": {"s": pair, "l": level, "bids": [["42000.1", "1"]], "asks": []}
+    })
+
+
+class TestOrderBookRouting:
+    """Order book updates reach only the stream of their pair and depth"""
+    
+    @pytest.mark.asyncio
+    async def test_books_of_one_pair_are_routed_by_depth(self):
+        client = make_client()
+        shallow, deep, other = asyncio.Queue(), asyncio.Queue(), asyncio.Queue()
+        await client.subscribe_order_book("BTC_USDT", shallow.put, depth=5)
+        await client.subscribe_order_book("BTC_USDT", deep.put, depth=20)
+        await client.subscribe_order_book("ETH_USDT", other.put, depth=5)
+        ws = await subscribed(client, 3)
+        assert [json.loads(frame)["payload"] for frame in ws.sent] == [
+            ["BTC_USDT", "5", "100ms"], ["BTC_USDT", "20", "100ms"], ["ETH_USDT", "5", "100ms"]
+        ]
+        
+        ws.feed(book_update("BTC_USDT", "20"))
+        
+        update = await asyncio.wait_for(deep.get(), 1)
+        assert (update["s"], update["l"]) == ("BTC_USDT", "20")
+        assert shallow.empty() and other.empty()
+        await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_ticker_pairs_share_one_frame_and_route_by_pair(self):
+        client = make_client()
+        btc, eth = asyncio.Queue(), asyncio.Queue()
+        await client.subscribe_ticker("BTC_USDT", btc.put)
+        await client.subscribe_ticker("ETH_USDT", eth.put)
+        ws = await subscribed(client, 1)
+        assert [json.loads(frame)["payload"] for frame in ws.sent] == [["BTC_USDT", "ETH_USDT"]]
+        
+        ws.feed(json.dumps({
+            "channel": "spot.tickers", "event": "update",
+            "result": {"currency_pair": "ETH_USDT", "last": "2200.5"}
+        }))
+        
+        assert (await asyncio.wait_for(eth.get(), 1))["last"] == "2200.5"
+        assert btc.empty()
+        await client.close()
@@ -0,0 +1,249 @@
+"""Unit Tests for the Huobi adapter.
+
+Requests go through a scripted FakeSession (see conftest.py), so these
+cover request building, retries and response handling offline.
+
+Author: v0-strategy-engine-pro
+Version: 1.0
+"""
+
+import asyncio
+import gzip
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import aiohttp
+import pytest
+
+from exchanges.base_exchange import OHLCV, Side
+import exchanges.huobi_api as huobi_api
+from exchanges.huobi_api import HuobiAPI
+
+from conftest import FakeResponse, FakeSession
+
+
+def make_client(*outcomes) -> HuobiAPI:
+    client = HuobiAPI(api_key="key", secret_key="secret")
+    client.session = FakeSession(*outcomes)
+    return client
+
+
+def ok(data) -> FakeResponse:
+    return FakeResponse({"status": "ok", "data": data})
+
+
+def make_order(quantity=0.5, price=None):
+    return SimpleNamespace(symbol="btcusdt", side=Side.BUY, quantity=quantity, price=price)
+
+
+ACCOUNTS = ok([{"id": 42, "type": "spot", "state": "working"}])
+PLACED = ok("1001")
+
+
+KLINES = ok([
+    {"id": 1700000000, "open": 2.0, "close": 3.0, "low": 1.0, "high": 4.0, "amount": 9.9, "vol": 150.25, "count": 7},
+    {"id": 1700003600, "open": 3.0, "close": 5.5, "low": 2.5, "high": 6.0, "amount": 8.8, "vol": 180.0, "count": 3},
+])
+
+
+class TestCandles:
+    """Kline dicts are parsed into OHLCV columns by field name"""
+    
+    @pytest.mark.asyncio
+    async def test_batch_columns_follow_field_names(self):
+        client = make_client(KLINES)
+        
+        batch = await client.get_historical_batch("btcusdt", "60min")
+        
+        assert len(batch) == 2
+        assert batch.open.tolist() == [2.0, 3.0]
+        assert batch.high.tolist() == [4.0, 6.0]
+        assert batch.low.tolist() == [1.0, 2.5]
+        assert batch.close.tolist() == [3.0, 5.5]
+        assert batch.volume.tolist() == [150.25, 180.0]
+    
+    @pytest.mark.asyncio
+    async def test_historical_data_returns_ohlcv_with_naive_utc_times(self):
+        client = make_client(KLINES)
+        
+        candles = await client.get_historical_data("btcusdt", "60min")
+        
+        assert candles == [
+            OHLCV(datetime(2023, 11, 14, 22, 13, 20), 2.0, 4.0, 1.0, 3.0, 150.25),
+            OHLCV(datetime(2023, 11, 14, 23, 13, 20), 3.0, 6.0, 2.5, 5.5, 180.0),
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_size_is_capped_at_2000(self):
+        client = make_client(ok([]))
+        
+        batch = await client.get_historical_batch("btcusdt", limit=5000)
+        
+        assert len(batch) == 0
+        assert "size=2000" in client.session.requests[0][1]
+
+
+class TestRetries:
+    """Order POSTs must not be resent once they may have reached Huobi"""
+    
+    @pytest.mark.asyncio
+    async def test_post_not_resent_after_timeout(self, no_sleep):
+        client = make_client(ACCOUNTS, asyncio.TimeoutError(), PLACED)
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await client.place_order(make_order())
+        
+        assert [method for method, _, _ in client.session.requests] == ["GET", "POST"]
+    
+    @pytest.mark.asyncio
+    async def test_post_not_resent_after_server_error(self, no_sleep):
+        client = make_client(ACCOUNTS, FakeResponse(status=502), PLACED)
+        
+        with pytest.raises(Exception, match="not retried"):
+            await client.place_order(make_order())
+        
+        assert len(client.session.requests) == 2
+    
+    @pytest.mark.asyncio
+    async def test_post_resent_when_connect_failed(self, no_sleep):
+        refused = aiohttp.ClientConnectorError(Mock(), OSError("connection refused"))
+        client = make_client(ACCOUNTS, refused, PLACED)
+        
+        assert await client.place_order(make_order()) == "1001"
+        assert [method for method, _, _ in client.session.requests] == ["GET", "POST", "POST"]
+    
+    @pytest.mark.asyncio
+    async def test_rate_limited_post_waits_retry_after(self, no_sleep):
+        client = make_client(ACCOUNTS, FakeResponse(status=429, headers={"Retry-After": "3"}), PLACED)
+        
+        assert await client.place_order(make_order()) == "1001"
+        assert no_sleep == [3.0]
+    
+    @pytest.mark.asyncio
+    async def test_get_resent_after_timeout(self, no_sleep):
+        client = make_client(asyncio.TimeoutError(), KLINES)
+        
+        batch = await client.get_historical_batch("btcusdt")
+        
+        assert len(batch) == 2
+        assert len(client.session.requests) == 2
+
+
+async def settle(rounds=5):
+    """Let scheduled callbacks and tasks run a few loop iterations"""
+    for _ in range(rounds):
+        await asyncio.sleep(0)
+
+
+def gzipped(message) -> bytes:
+    return gzip.compress(json.dumps(message).encode())
+
+
+class TestWebSocketFrames:
+    """Huobi gzips every frame and drops clients that miss a ping"""
+    
+    @pytest.mark.asyncio
+    async def test_gzip_frame_is_decoded_for_the_callback(self):
+        client = make_client()
+        received = asyncio.Queue()
+        await client.subscribe_ticker("btcusdt", received.put)
+        await settle()
+        ws = client.session.websockets[0]
+        assert json.loads(ws.sent[0])["sub"] == "market.btcusdt.detail"
+        
+        update = {"ch": "market.btcusdt.detail", "tick": {"close": 42000.5}}
+        ws.feed(gzipped(update), aiohttp.WSMsgType.BINARY)
+        
+        assert await asyncio.wait_for(received.get(), 1) == update
+        await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_ping_is_answered_with_pong(self):
+        client = make_client()
+        callback = asyncio.Queue()
+        await client.subscribe_ticker("btcusdt", callback.put)
+        await settle()
+        ws = client.session.websockets[0]
+        
+        ws.feed(gzipped({"ping": 1700000000123}), aiohttp.WSMsgType.BINARY)
+        await settle()
+        
+        assert json.loads(ws.sent[-1]) == {"pong": 1700000000123}
+        assert callback.empty()
+        await client.close()
+
+
+class TestTopicFanOut:
+    """Streams that share a Huobi topic share one subscription"""
+    
+    @pytest.mark.asyncio
+    async def test_each_stream_on_a_topic_gets_its_frames(self):
+        client = make_client()
+        shallow, deep = asyncio.Queue(), asyncio.Queue()
+        await client.subscribe_order_book("btcusdt", shallow.put, depth=5)
+        await settle()
+        await client.subscribe_order_book("btcusdt", deep.put, depth=20)
+        await settle()
+        ws = client.session.websockets[0]
+        assert [json.loads(frame)["sub"] for frame in ws.sent] == ["market.btcusdt.depth.step0"]
+        
+        update = {"ch": "market.btcusdt.depth.step0", "tick": {"bids": [[42000.0, 1.0]], "asks": []}}
+        ws.feed(gzipped(update), aiohttp.WSMsgType.BINARY)
+        
+        assert await asyncio.wait_for(shallow.get(), 1) == update
+        assert await asyncio.wait_for(deep.get(), 1) == update
+        await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_other_topics_are_not_delivered(self):
+        client = make_client()
+        trades = asyncio.Queue()
+        await client.subscribe_trades("btcusdt", trades.put)
+        await settle()
+        ws = client.session.websockets[0]
+        
+        ws.feed(gzipped({"ch": "market.ethusdt.trade.detail", "tick": {}}), aiohttp.WSMsgType.BINARY)
+        await settle()
+        
+        assert trades.empty()
+        await client.close()
+
+
+class TestBackoff:
+    """Retry and reconnect waits are jittered around a capped schedule"""
+    
+    @pytest.mark.parametrize("jitter, expected", [(min, [0.25, 0.5]), (max, [0.75, 1.5])])
+    @pytest.mark.asyncio
+    async def test_retry_waits_stay_within_jitter_bounds(self, monkeypatch, no_sleep, jitter, expected):
+        monkeypatch.setattr(huobi_api, "random", SimpleNamespace(uniform=jitter))
+        client = make_client(*[FakeResponse(status=503)] * 3)
+        
+        with pytest.raises(Exception, match="Max retries exceeded"):
+            await client.get_historical_batch("btcusdt")
+        
+        assert no_sleep == expected
+    
+    @pytest.mark.asyncio
+    async def test_reconnect_wait_is_capped(self, monkeypatch):
+        monkeypatch.setattr(huobi_api, "random", SimpleNamespace(uniform=max))
+        client = make_client()
+        client.session.ws_connect = Mock(side_effect=OSError("connection refused"))
+        delays = []
+        gave_up = asyncio.Event()
+        
+        async def fake_sleep(delay, result=None):
+            delays.append(delay)
+            if len(delays) == 12:
+                # Park the reconnect loop until close() cancels it
+                gave_up.set()
+                await asyncio.Event().wait()
+        
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        await client.subscribe_ticker("btcusdt", Mock())
+        await asyncio.wait_for(gave_up.wait(), 1)
+        await client.close()
+        
+        assert delays[:3] == [0.75, 1.5, 3.0]
+        assert delays[-4:] == [90.0] * 4